@@ -0,0 +1,275 @@
+"""
+Application base for Restaurant Order Management System.
+
+This module contains the frontend-independent application lifecycle:
+logging and directory setup, system checks, startup and shutdown.
+Entry points supply the main window through a factory.
+"""
+
+import sys
+import time
+import queue
+import atexit
+import logging
+import logging.handlers
+from pathlib import Path
+from typing import Any, Callable
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Log formatter that formats the ``asctime`` field once per second.
+
+    Records logged within the same second share the cached date/time
+    prefix; only the millisecond tail is formatted per record.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the formatter with an empty time cache."""
+        super().__init__(*args, **kwargs)
+        self._cached_time = (None, "")
+
+    def formatTime(self, record, datefmt=None):
+        """Return the record creation time, reusing the cached prefix."""
+        if datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, prefix = self._cached_time
+        if second != cached_second:
+            prefix = time.strftime(self.default_time_format, self.converter(record.created))
+            self._cached_time = (second, prefix)
+        return self.default_msec_format % (prefix, record.msecs)
+
+
+class RestaurantApplication:
+    """
+    Main application class for the Restaurant Order Management System.
+
+    Handles application initialization, configuration management,
+    error handling, and graceful shutdown procedures.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, window_factory: Callable[[], Any]):
+        """
+        Initialize the restaurant application.
+
+        Args:
+            window_factory (Callable[[], Any]): Creates the frontend main window;
+                only called once the application is initialized
+        """
+        self.app_name = "Restaurant Order Management System"
+        self.version = "1.0.0"
+        self.main_window = None
+        self._window_factory = window_factory
+
+        # Setup logging
+        self.setup_logging()
+
+        # Setup application directories
+        self.setup_directories()
+
+        self.logger.info(f"Starting {self.app_name} v{self.version}")
+
+    def setup_logging(self):
+        """Setup application logging configuration."""
+        # Create logs directory if it doesn't exist
+        logs_dir = Path(__file__).parent / "logs"
+        logs_dir.mkdir(exist_ok=True)
+
+        # Configure logging
+        log_file = logs_dir / "restaurant_system.log"
+
+        # Skip collecting record fields that the format never uses
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
+        formatter = CachedTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handlers = [
+            logging.FileHandler(log_file, encoding='utf-8'),
+            logging.StreamHandler(sys.stdout)
+        ]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        # Callers only enqueue records; formatting and I/O happen on the
+        # listener's background thread
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+        self.log_listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        self.log_listener.start()
+        atexit.register(self.log_listener.stop)
+
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+
+        # Set specific log levels for different modules
+        logging.getLogger('webview').setLevel(logging.WARNING)
+        logging.getLogger('PIL').setLevel(logging.WARNING)
+
+    def setup_directories(self):
+        """Setup required application directories."""
+        try:
+            # Data directory
+            data_dir = Path(__file__).parent / "data"
+            data_dir.mkdir(exist_ok=True)
+
+            # Backup directory
+            backup_dir = data_dir / "backups"
+            backup_dir.mkdir(exist_ok=True)
+
+            # Reports directory
+            reports_dir = Path(__file__).parent / "reports"
+            reports_dir.mkdir(exist_ok=True)
+
+            # Receipts directory
+            receipts_dir = Path(__file__).parent / "receipts"
+            receipts_dir.mkdir(exist_ok=True)
+
+            self.logger.info("Application directories setup completed")
+
+        except Exception as e:
+            self.logger.error(f"Failed to setup directories: {e}")
+            raise
+
+    def check_system_requirements(self):
+        """Check system requirements and dependencies."""
+        try:
+            # Check Python version
+            if sys.version_info < (3, 8):
+                raise SystemError("Python 3.8 or higher is required")
+
+            # Check required modules
+            required_modules = [
+                'webview',
+                'csv',
+                'json',
+                'datetime',
+                'decimal',
+                'pathlib',
+                'logging',
+                'uuid'
+            ]
+
+            missing_modules = []
+            for module in required_modules:
+                try:
+                    __import__(module)
+                except ImportError:
+                    missing_modules.append(module)
+
+            if missing_modules:
+                raise ImportError(f"Missing required modules: {', '.join(missing_modules)}")
+
+            # Check webview availability
+            try:
+                import webview
+
+                # Test webview import and basic functionality
+                test_window = webview.create_window("Test", "about:blank", width=1, height=1)
+                # Clear the test window from memory
+                webview.windows.clear()
+            except Exception as e:
+                raise SystemError(f"WebView framework not available: {e}")
+
+            self.logger.info("System requirements check passed")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"System requirements check failed: {e}")
+            return False
+
+    def initialize_application(self):
+        """Initialize the main application."""
+        try:
+            # Check system requirements
+            if not self.check_system_requirements():
+                try:
+                    import tkinter
+                    from tkinter import messagebox
+                    root = tkinter.Tk()
+                    root.withdraw()
+                    messagebox.showerror(
+                        "System Requirements",
+                        "System requirements not met. Please check the logs for details.\n\n"
+                        "Required: pip install webview"
+                    )
+                    root.destroy()
+                except:
+                    print("System requirements not met. Please install webview: pip install webview")
+                return False
+
+            # Initialize main window
+            self.main_window = self._window_factory()
+
+            self.logger.info("Application initialized successfully")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Failed to initialize application: {e}")
+            try:
+                import tkinter
+                from tkinter import messagebox
+                root = tkinter.Tk()
+                root.withdraw()
+                messagebox.showerror(
+                    "Initialization Error",
+                    f"Failed to initialize application:\n{e}\n\nCheck the log file for details."
+                )
+                root.destroy()
+            except:
+                print(f"Failed to initialize application: {e}")
+            return False
+
+    def run(self):
+        """Run the main application."""
+        try:
+            if self.initialize_application():
+                self.logger.info("Starting main application loop")
+                self.main_window.run()
+            else:
+                self.logger.error("Failed to start application")
+                return 1
+
+        except KeyboardInterrupt:
+            self.logger.info("Application interrupted by user")
+            return 0
+
+        except Exception as e:
+            self.logger.error(f"Unexpected application error: {e}")
+            try:
+                import tkinter
+                from tkinter import messagebox
+                root = tkinter.Tk()
+                root.withdraw()
+                messagebox.showerror(
+                    "Application Error",
+                    f"An unexpected error occurred:\n{e}\n\nThe application will close."
+                )
+                root.destroy()
+            except:
+                print(f"An unexpected error occurred: {e}")
+            return 1
+
+        finally:
+            self.cleanup()
+
+        self.logger.info("Application shutdown completed")
+        return 0
+
+    def cleanup(self):
+        """Cleanup resources before application shutdown."""
+        try:
+            if self.main_window:
+                self.main_window.cleanup()
+
+            self.logger.info("Application cleanup completed")
+
+        except Exception as e:
+            self.logger.error(f"Error during cleanup: {e}")
@@ -45,7 +45,7 @@ BACKUP_DIR = DATA_DIR / "backups"
 
 # Data Files
 MENU_ITEMS_FILE = DATA_DIR / "menu_items.csv"
-ORDERS_FILE = DATA_DIR / "orders.csv"
+ORDERS_FILE = DATA_DIR / "orders.jsonl"
 SALES_REPORTS_FILE = DATA_DIR / "sales_reports.csv"
 
 # Auto-save Settings
@@ -453,14 +453,14 @@ class DataRestoreDialog:
                 self.status_text.insert(tk.END, "✓ Menu items file: Created empty structure\n")
 
             # Recreate orders file
-            orders_file = DATA_DIR / "orders.csv"
+            orders_file = DATA_DIR / "orders.jsonl"
             try:
                 menu_dict = {item.id: item for item in self.csv_handler.load_menu_items()}
-                existing_orders = self.csv_handler.load_orders(menu_dict)
+                existing_orders = self.csv_handler.load_orders(menu_dict.get)
                 self.csv_handler.save_orders(existing_orders)
                 self.status_text.insert(tk.END, f"✓ Orders file: {len(existing_orders)} orders preserved\n")
             except:
-                orders_file.write_text("order_id,customer_name,customer_phone,table_number,order_type,status,order_time,items\n")
+                orders_file.write_text("")
                 self.status_text.insert(tk.END, "✓ Orders file: Created empty structure\n")
 
             # Recreate sales reports file
@@ -277,14 +277,10 @@ class RestaurantMainWindow:
     def load_data(self) -> None:
         """Load all data from CSV files."""
         try:
-            # Load menu items
-            self.menu_items = self.csv_handler.load_menu_items()
+            # Load menu items and orders (and warm the sales cache) concurrently
+            self.menu_items, self.orders, _ = self.csv_handler.load_all()
             self.menu_manager_tab.update_menu_items(self.menu_items)
             self.order_interface_tab.refresh_menu_items(self.menu_items)
-
-            # Load orders
-            menu_items_dict = {item.id: item for item in self.menu_items}
-            self.orders = self.csv_handler.load_orders(menu_items_dict)
             self.queue_display_tab.refresh_orders(self.orders)
 
             self.update_status_counts()
@@ -306,6 +302,10 @@ class RestaurantMainWindow:
             if not self.csv_handler.save_orders(self.orders):
                 raise Exception("Failed to save orders")
 
+            # Write out any buffered sales records
+            if not self.csv_handler.flush_sales(force=True):
+                raise Exception("Failed to save sales records")
+
             self.update_status("All data saved successfully")
 
         except Exception as e:
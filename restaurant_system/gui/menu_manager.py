@@ -42,6 +42,9 @@ class MenuManagerTab:
         # Selected item tracking
         self.selected_item: Optional[MenuItem] = None
 
+        # Form validators, specialized once per field
+        self._validate_name = InputValidator.make_string_validator("Name")
+
         # Create the main frame
         self.frame = ttk.Frame(parent, padding="10")
 
@@ -532,9 +535,7 @@ class MenuManagerTab:
         """Save changes to the menu item."""
         try:
             # Validate form data
-            name = InputValidator.validate_required_string(
-                self.form_vars['name'].get(), "Name"
-            )
+            name = self._validate_name(self.form_vars['name'].get())
             category = InputValidator.validate_category(
                 self.form_vars['category'].get(), list(MenuItem.VALID_CATEGORIES)
             )
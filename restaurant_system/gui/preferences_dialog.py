@@ -400,9 +400,7 @@ class PreferencesDialog:
         """Validate all settings before applying."""
         try:
             # Validate tax rate
-            tax_rate = float(self.tax_rate_var.get())
-            if tax_rate < 0 or tax_rate > 100:
-                raise ValueError("Tax rate must be between 0 and 100")
+            InputValidator.validate_tax_rate_percent(self.tax_rate_var.get())
 
             # Validate decimal places
             decimal_places = int(self.decimal_places_var.get())
@@ -34,6 +34,7 @@ class ReportsTab:
         self.parent = parent
         self.csv_handler = csv_handler
         self.logger = logging.getLogger(__name__)
+        self._parse_date = InputValidator.make_date_parser('%Y-%m-%d')
 
         # Data storage
         self.sales_data: List[Dict[str, Any]] = []
@@ -457,8 +458,9 @@ class ReportsTab:
 
             # Filter data
             self.filtered_data = []
+            parse_date = self._parse_date
             for record in self.sales_data:
-                record_date = datetime.strptime(record['date'], '%Y-%m-%d')
+                record_date = parse_date(record['date'])
 
                 if start_dt and record_date < start_dt:
                     continue
@@ -9,7 +9,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
 from decimal import Decimal
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import random
 from typing import List, Callable
 
@@ -251,12 +251,13 @@ class SampleDataDialog:
             order.customer_phone = random.choice(phone_numbers)
             order.table_number = f"Table {random.randint(1, 20)}" if random.choice([True, False]) else ""
             order.order_type = random.choice(order_types)
-            order.status = random.choice(order_statuses)
+            order.update_status(random.choice(order_statuses))
 
             # Set random order time within date range
             time_diff = end_date - start_date
             random_seconds = random.randint(0, int(time_diff.total_seconds()))
-            order.order_time = start_date + timedelta(seconds=random_seconds)
+            order_time = start_date + timedelta(seconds=random_seconds)
+            order._timestamp = order_time.astimezone(timezone.utc)
 
             # Add random items to order
             num_items = random.randint(1, 5)
@@ -325,7 +326,7 @@ class SampleDataDialog:
 
                 # Load existing orders
                 menu_dict = {item.id: item for item in menu_items}
-                existing_orders = self.csv_handler.load_orders(menu_dict)
+                existing_orders = self.csv_handler.load_orders(menu_dict.get)
 
                 # Generate new orders
                 new_orders = self.generate_sample_orders(menu_items, num_orders, date_range)
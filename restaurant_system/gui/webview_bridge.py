@@ -18,6 +18,8 @@ from datetime import datetime
 from ..models import MenuItem, Order, OrderItem, OrderStatus, OrderType
 from ..utils import CSVHandler, InputValidator, ReceiptGenerator
 
+logger = logging.getLogger(__name__)
+
 
 class WebViewAPI:
     """
@@ -33,7 +35,6 @@ class WebViewAPI:
         self.csv_handler = CSVHandler(str(data_dir))
         self.receipt_generator = ReceiptGenerator()
         self.validator = InputValidator()
-        self.logger = logging.getLogger(__name__)
 
         # Data storage
         self.menu_items: List[MenuItem] = []
@@ -42,28 +43,22 @@ class WebViewAPI:
         # Load initial data
         self.load_data()
 
-        self.logger.info("WebView API bridge initialized")
+        logger.info("WebView API bridge initialized")
 
     def load_data(self) -> None:
         """Load data from CSV files."""
         try:
-            # Load menu items
-            self.menu_items = self.csv_handler.load_menu_items()
-
-            # Create menu items dictionary for order loading
-            menu_items_dict = {item.id: item for item in self.menu_items}
-
-            # Load orders
-            self.orders = self.csv_handler.load_orders(menu_items_dict)
+            # Load menu items and orders (and warm the sales cache) concurrently
+            self.menu_items, self.orders, _ = self.csv_handler.load_all()
 
             # Create sample menu items if none exist
             if len(self.menu_items) == 0:
                 self.create_sample_menu_items()
 
-            self.logger.info(f"Loaded {len(self.menu_items)} menu items and {len(self.orders)} orders")
+            logger.info(f"Loaded {len(self.menu_items)} menu items and {len(self.orders)} orders")
 
         except Exception as e:
-            self.logger.error(f"Error loading data: {e}")
+            logger.error(f"Error loading data: {e}")
 
     def create_sample_menu_items(self) -> None:
         """Create sample menu items for demonstration."""
@@ -98,10 +93,10 @@ class WebViewAPI:
 
             self.menu_items.extend(sample_items)
             self.save_data()
-            self.logger.info(f"Created {len(sample_items)} sample menu items")
+            logger.info(f"Created {len(sample_items)} sample menu items")
 
         except Exception as e:
-            self.logger.error(f"Error creating sample menu items: {e}")
+            logger.error(f"Error creating sample menu items: {e}")
 
     def save_data(self) -> None:
         """Save data to CSV files."""
@@ -112,10 +107,13 @@ class WebViewAPI:
             # Save orders
             self.csv_handler.save_orders(self.orders)
 
-            self.logger.info("Data saved successfully")
+            # Write out any buffered sales records
+            self.csv_handler.flush_sales(force=True)
+
+            logger.info("Data saved successfully")
 
         except Exception as e:
-            self.logger.error(f"Error saving data: {e}")
+            logger.error(f"Error saving data: {e}")
             raise
 
     def handleRequest(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -133,7 +131,7 @@ class WebViewAPI:
             data = request_data.get('data', {})
             request_id = request_data.get('id')
 
-            self.logger.debug(f"Handling request: {method}")
+            logger.debug(f"Handling request: {method}")
 
             # Route to appropriate method
             if method == 'getMenuItems':
@@ -182,7 +180,7 @@ class WebViewAPI:
             return response
 
         except Exception as e:
-            self.logger.error(f"Error handling request {method}: {e}")
+            logger.error(f"Error handling request {method}: {e}")
 
             error_response = {
                 'id': request_data.get('id'),
@@ -199,9 +197,9 @@ class WebViewAPI:
 
     def get_menu_items(self) -> List[Dict[str, Any]]:
         """Get all menu items."""
-        self.logger.info(f"🍽️ API: get_menu_items called - returning {len(self.menu_items)} items")
+        logger.info(f"🍽️ API: get_menu_items called - returning {len(self.menu_items)} items")
         result = [item.to_dict() for item in self.menu_items]
-        self.logger.info(f"✅ API: Successfully serialized {len(result)} menu items")
+        logger.info(f"✅ API: Successfully serialized {len(result)} menu items")
         return result
 
     def add_menu_item(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -274,21 +272,6 @@ class WebViewAPI:
         if not data.get('items'):
             raise ValueError("Order must contain items")
 
-        # Create order items
-        order_items = []
-        for item_data in data['items']:
-            # Find menu item
-            menu_item = next((item for item in self.menu_items if item.id == item_data['id']), None)
-            if not menu_item:
-                raise ValueError(f"Menu item not found: {item_data['id']}")
-
-            order_item = OrderItem(
-                menu_item=menu_item,
-                quantity=item_data['quantity'],
-                special_instructions=item_data.get('instructions', '')
-            )
-            order_items.append(order_item)
-
         # Create order
         order = Order(
             customer_name=data.get('customer_name', ''),
@@ -298,8 +281,14 @@ class WebViewAPI:
         )
 
         # Add items to the order
-        for order_item in order_items:
-            order._items.append(order_item)
+        for item_data in data['items']:
+            # Find menu item
+            menu_item = next((item for item in self.menu_items if item.id == item_data['id']), None)
+            if not menu_item:
+                raise ValueError(f"Menu item not found: {item_data['id']}")
+
+            order.add_item(menu_item, item_data['quantity'],
+                           item_data.get('instructions', ''))
 
         self.orders.append(order)
         self.save_data()
@@ -312,30 +301,30 @@ class WebViewAPI:
 
     def get_orders(self, data: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """Get all orders with optional filtering."""
-        self.logger.info(f"📋 API: get_orders called with data: {data}")
+        logger.info(f"📋 API: get_orders called with data: {data}")
 
         orders = self.orders
-        self.logger.info(f"📊 API: Found {len(orders)} total orders")
+        logger.info(f"📊 API: Found {len(orders)} total orders")
 
         # Apply filters if provided
         if data:
             status_filter = data.get('status')
             if status_filter:
                 orders = [order for order in orders if order.status.value == status_filter]
-                self.logger.info(f"🏷️ API: Filtered to {len(orders)} orders by status: {status_filter}")
+                logger.info(f"🏷️ API: Filtered to {len(orders)} orders by status: {status_filter}")
 
             date_filter = data.get('date')
             if date_filter:
                 # Filter by date (implement as needed)
-                self.logger.info(f"📅 API: Date filter requested: {date_filter} (not implemented)")
+                logger.info(f"📅 API: Date filter requested: {date_filter} (not implemented)")
                 pass
 
         try:
-            result = [order.to_dict() for order in orders]
-            self.logger.info(f"✅ API: Successfully serialized {len(result)} orders")
+            result = Order.bulk_to_dict(orders)
+            logger.info(f"✅ API: Successfully serialized {len(result)} orders")
             return result
         except Exception as e:
-            self.logger.error(f"❌ API: Error serializing orders: {e}")
+            logger.error(f"❌ API: Error serializing orders: {e}")
             raise
 
     def update_order_status(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -471,7 +460,7 @@ class WebViewAPI:
         else:
             sorted_time_breakdown = []
 
-        self.logger.info(f"📊 Sales data calculated for period '{period}': ${total_sales:.2f} from {orders_count} orders")
+        logger.info(f"📊 Sales data calculated for period '{period}': ${total_sales:.2f} from {orders_count} orders")
 
         return {
             'totalSales': float(total_sales),
@@ -559,7 +548,7 @@ class WebViewAPI:
                         for time_key, data in sales_data['timeBreakdown']:
                             writer.writerow([time_key, f"${data['sales']:.2f}", data['orders']])
 
-                self.logger.info(f"📄 Sales report exported to: {file_path}")
+                logger.info(f"📄 Sales report exported to: {file_path}")
 
                 return {
                     'success': True,
@@ -569,7 +558,7 @@ class WebViewAPI:
                 }
 
             except Exception as e:
-                self.logger.error(f"Error exporting sales report: {e}")
+                logger.error(f"Error exporting sales report: {e}")
                 raise ValueError(f"Failed to export sales report: {str(e)}")
         else:
             raise ValueError(f"Unsupported export type: {export_type}")
@@ -602,7 +591,7 @@ class WebViewAPI:
 
             backup_data = {
                 'menu_items': [item.to_dict() for item in self.menu_items],
-                'orders': [order.to_dict() for order in self.orders],
+                'orders': Order.bulk_to_dict(self.orders),
                 'created_at': datetime.now().isoformat()
             }
 
@@ -694,8 +683,6 @@ class ModernRestaurantWindow:
 
     def __init__(self):
         """Initialize the modern restaurant window."""
-        self.logger = logging.getLogger(__name__)
-
         # Setup data directory
         self.data_dir = Path(__file__).parent.parent / "data"
         self.data_dir.mkdir(exist_ok=True)
@@ -706,7 +693,7 @@ class ModernRestaurantWindow:
         # WebView window
         self.window = None
 
-        self.logger.info("Modern Restaurant Window initialized")
+        logger.info("Modern Restaurant Window initialized")
 
     def run(self):
         """Run the modern restaurant application."""
@@ -714,16 +701,16 @@ class ModernRestaurantWindow:
             # Get the HTML file path
             html_file = Path(__file__).parent / "index.html"
 
-            self.logger.info(f"Looking for HTML file at: {html_file}")
+            logger.info(f"Looking for HTML file at: {html_file}")
 
             if not html_file.exists():
                 raise FileNotFoundError(f"HTML file not found: {html_file}")
 
-            self.logger.info("HTML file found, creating webview window...")
+            logger.info("HTML file found, creating webview window...")
 
             # Create webview window
-            self.logger.info(f"🔧 Creating webview window with API bridge: {type(self.api)}")
-            self.logger.info(f"🔍 API methods: {[method for method in dir(self.api) if not method.startswith('_')]}")
+            logger.info(f"🔧 Creating webview window with API bridge: {type(self.api)}")
+            logger.info(f"🔍 API methods: {[method for method in dir(self.api) if not method.startswith('_')]}")
 
             self.window = webview.create_window(
                 title="Restaurant Order Management System",
@@ -737,7 +724,7 @@ class ModernRestaurantWindow:
                 minimized=False
             )
 
-            self.logger.info("Webview window created, starting webview...")
+            logger.info("Webview window created, starting webview...")
 
             # Add window event handlers
             def on_window_loaded():
@@ -746,28 +733,28 @@ class ModernRestaurantWindow:
                     # Try to maximize the window
                     if hasattr(self.window, 'maximize'):
                         self.window.maximize()
-                        self.logger.info("Window maximized successfully")
+                        logger.info("Window maximized successfully")
                     else:
                         # Fallback: try to resize to screen dimensions
                         self.window.resize(1920, 1080)
-                        self.logger.info("Window resized to fullscreen dimensions")
+                        logger.info("Window resized to fullscreen dimensions")
                 except Exception as e:
-                    self.logger.warning(f"Could not maximize window: {e}")
+                    logger.warning(f"Could not maximize window: {e}")
 
             # Set window loaded event
             self.window.events.loaded += on_window_loaded
 
             # Start webview
-            self.logger.info("🌐 Starting webview with HTTP server...")
+            logger.info("🌐 Starting webview with HTTP server...")
             webview.start(
                 debug=True,  # Enable debug mode to see browser console
                 http_server=True  # Enable local HTTP server for assets
             )
 
-            self.logger.info("Webview started successfully")
+            logger.info("Webview started successfully")
 
         except Exception as e:
-            self.logger.error(f"Failed to start modern interface: {e}")
+            logger.error(f"Failed to start modern interface: {e}")
             raise
 
     def cleanup(self):
@@ -775,9 +762,9 @@ class ModernRestaurantWindow:
         try:
             if self.api:
                 self.api.save_data()
-            self.logger.info("Cleanup completed")
+            logger.info("Cleanup completed")
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+            logger.error(f"Error during cleanup: {e}")
 
 
 # Export the main window class for compatibility
@@ -3,237 +3,38 @@
 Main entry point for Restaurant Order Management System.
 
 This module serves as the primary entry point for the restaurant management
-application, providing initialization, configuration, and startup procedures.
+application. It selects the webview frontend and hands it to the shared
+application lifecycle in ``app_base``.
 """
 
 import sys
-import os
-import logging
 from pathlib import Path
-import webview
-from tkinter import messagebox
 
 # Add the project root to Python path for imports
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-try:
-    from restaurant_system.gui.webview_bridge import RestaurantMainWindow
-except ImportError as e:
-    print(f"Failed to import required modules: {e}")
-    print("Please ensure all dependencies are installed and the project structure is correct.")
-    print("Run: pip install webview")
-    sys.exit(1)
+from restaurant_system.app_base import RestaurantApplication
 
 
-class RestaurantApplication:
-    """
-    Main application class for the Restaurant Order Management System.
-
-    Handles application initialization, configuration management,
-    error handling, and graceful shutdown procedures.
-    """
-
-    def __init__(self):
-        """Initialize the restaurant application."""
-        self.app_name = "Restaurant Order Management System"
-        self.version = "1.0.0"
-        self.main_window = None
-
-        # Setup logging
-        self.setup_logging()
-        self.logger = logging.getLogger(__name__)
-
-        # Setup application directories
-        self.setup_directories()
-
-        self.logger.info(f"Starting {self.app_name} v{self.version}")
-
-    def setup_logging(self):
-        """Setup application logging configuration."""
-        # Create logs directory if it doesn't exist
-        logs_dir = Path(__file__).parent / "logs"
-        logs_dir.mkdir(exist_ok=True)
-
-        # Configure logging
-        log_file = logs_dir / "restaurant_system.log"
-
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file, encoding='utf-8'),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
-
-        # Set specific log levels for different modules
-        logging.getLogger('webview').setLevel(logging.WARNING)
-        logging.getLogger('PIL').setLevel(logging.WARNING)
-
-    def setup_directories(self):
-        """Setup required application directories."""
-        try:
-            # Data directory
-            data_dir = Path(__file__).parent / "data"
-            data_dir.mkdir(exist_ok=True)
-
-            # Backup directory
-            backup_dir = data_dir / "backups"
-            backup_dir.mkdir(exist_ok=True)
-
-            # Reports directory
-            reports_dir = Path(__file__).parent / "reports"
-            reports_dir.mkdir(exist_ok=True)
-
-            # Receipts directory
-            receipts_dir = Path(__file__).parent / "receipts"
-            receipts_dir.mkdir(exist_ok=True)
-
-            self.logger.info("Application directories setup completed")
-
-        except Exception as e:
-            self.logger.error(f"Failed to setup directories: {e}")
-            raise
-
-    def check_system_requirements(self):
-        """Check system requirements and dependencies."""
-        try:
-            # Check Python version
-            if sys.version_info < (3, 8):
-                raise SystemError("Python 3.8 or higher is required")
-
-            # Check required modules
-            required_modules = [
-                'webview',
-                'csv',
-                'json',
-                'datetime',
-                'decimal',
-                'pathlib',
-                'logging',
-                'uuid'
-            ]
-
-            missing_modules = []
-            for module in required_modules:
-                try:
-                    __import__(module)
-                except ImportError:
-                    missing_modules.append(module)
-
-            if missing_modules:
-                raise ImportError(f"Missing required modules: {', '.join(missing_modules)}")
-
-            # Check webview availability
-            try:
-                # Test webview import and basic functionality
-                test_window = webview.create_window("Test", "about:blank", width=1, height=1)
-                # Clear the test window from memory
-                webview.windows.clear()
-            except Exception as e:
-                raise SystemError(f"WebView framework not available: {e}")
-
-            self.logger.info("System requirements check passed")
-            return True
-
-        except Exception as e:
-            self.logger.error(f"System requirements check failed: {e}")
-            return False
-
-    def initialize_application(self):
-        """Initialize the main application."""
-        try:
-            # Check system requirements
-            if not self.check_system_requirements():
-                try:
-                    import tkinter
-                    from tkinter import messagebox
-                    root = tkinter.Tk()
-                    root.withdraw()
-                    messagebox.showerror(
-                        "System Requirements",
-                        "System requirements not met. Please check the logs for details.\n\n"
-                        "Required: pip install webview"
-                    )
-                    root.destroy()
-                except:
-                    print("System requirements not met. Please install webview: pip install webview")
-                return False
-
-            # Initialize main window
-            self.main_window = RestaurantMainWindow()
-
-            self.logger.info("Application initialized successfully")
-            return True
-
-        except Exception as e:
-            self.logger.error(f"Failed to initialize application: {e}")
-            try:
-                import tkinter
-                from tkinter import messagebox
-                root = tkinter.Tk()
-                root.withdraw()
-                messagebox.showerror(
-                    "Initialization Error",
-                    f"Failed to initialize application:\n{e}\n\nCheck the log file for details."
-                )
-                root.destroy()
-            except:
-                print(f"Failed to initialize application: {e}")
-            return False
-
-    def run(self):
-        """Run the main application."""
-        try:
-            if self.initialize_application():
-                self.logger.info("Starting main application loop")
-                self.main_window.run()
-            else:
-                self.logger.error("Failed to start application")
-                return 1
-
-        except KeyboardInterrupt:
-            self.logger.info("Application interrupted by user")
-            return 0
-
-        except Exception as e:
-            self.logger.error(f"Unexpected application error: {e}")
-            try:
-                import tkinter
-                from tkinter import messagebox
-                root = tkinter.Tk()
-                root.withdraw()
-                messagebox.showerror(
-                    "Application Error",
-                    f"An unexpected error occurred:\n{e}\n\nThe application will close."
-                )
-                root.destroy()
-            except:
-                print(f"An unexpected error occurred: {e}")
-            return 1
-
-        finally:
-            self.cleanup()
-
-        self.logger.info("Application shutdown completed")
-        return 0
-
-    def cleanup(self):
-        """Cleanup resources before application shutdown."""
-        try:
-            if self.main_window:
-                self.main_window.cleanup()
-
-            self.logger.info("Application cleanup completed")
+def create_main_window():
+    """Create the webview main window, importing the GUI only when needed."""
+    try:
+        from restaurant_system.gui.webview_bridge import RestaurantMainWindow
+    except ImportError as e:
+        print(f"Failed to import required modules: {e}")
+        print("Please ensure all dependencies are installed and the project structure is correct.")
+        print("Run: pip install webview")
+        raise
 
-        except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+    return RestaurantMainWindow()
 
 
 def show_startup_splash():
     """Show a startup splash screen with modern styling."""
     try:
+        import webview
+
         # Create a simple splash using webview
         splash_html = """
         <!DOCTYPE html>
@@ -330,7 +131,7 @@ def main():
         # show_startup_splash()  # Commented out to avoid blocking
 
         # Create and run application
-        app = RestaurantApplication()
+        app = RestaurantApplication(create_main_window)
         return app.run()
 
     except Exception as e:
@@ -6,6 +6,6 @@ This package contains all data models used throughout the application.
 
 from .menu_item import MenuItem
 from .order_item import OrderItem
-from .order import Order, OrderStatus, OrderType
+from .order import Order, OrderStatus, OrderType, StatusChange
 
-__all__ = ['MenuItem', 'OrderItem', 'Order', 'OrderStatus', 'OrderType']
\ No newline at end of file
+__all__ = ['MenuItem', 'OrderItem', 'Order', 'OrderStatus', 'OrderType', 'StatusChange']
\ No newline at end of file
@@ -7,6 +7,7 @@ with comprehensive properties and validation.
 
 from decimal import Decimal, InvalidOperation
 from typing import Optional
+import sys
 import uuid
 
 
@@ -41,7 +42,9 @@ class MenuItem:
         Raises:
             ValueError: If invalid parameters are provided
         """
-        self._id = item_id or str(uuid.uuid4())
+        self._id = sys.intern(item_id or str(uuid.uuid4()))
+        # The ID never changes, so hash it once instead of on every lookup
+        self._hash = hash(self._id)
         self.name = name
         self.category = category
         self.price = price
@@ -114,9 +117,17 @@ class MenuItem:
             if decimal_price < 0:
                 raise ValueError("Price cannot be negative")
             self._price = decimal_price.quantize(Decimal('0.01'))
+            # Cached integer-cents and float views of the price
+            self._price_cents = int(self._price * 100)
+            self._price_float = float(self._price)
         except (InvalidOperation, TypeError):
             raise ValueError("Invalid price format")
 
+    @property
+    def price_cents(self) -> int:
+        """Get the price of the menu item in integer cents."""
+        return self._price_cents
+
     @property
     def description(self) -> str:
         """Get the description of the menu item."""
@@ -135,7 +146,7 @@ class MenuItem:
     @is_available.setter
     def is_available(self, value: bool) -> None:
         """Set the availability status of the menu item."""
-        self._is_available = bool(value)
+        self._is_available = value if value is True or value is False else bool(value)
 
     def to_dict(self) -> dict:
         """
@@ -144,13 +155,14 @@ class MenuItem:
         Returns:
             dict: Dictionary containing all menu item properties
         """
+        # Read the backing attributes directly; the properties add nothing here
         return {
-            'id': self.id,
-            'name': self.name,
-            'category': self.category,
-            'price': float(self.price),
-            'description': self.description,
-            'is_available': self.is_available
+            'id': self._id,
+            'name': self._name,
+            'category': self._category,
+            'price': self._price_float,
+            'description': self._description,
+            'is_available': self._is_available
         }
 
     @classmethod
@@ -192,8 +204,8 @@ class MenuItem:
         """Check equality based on item ID."""
         if not isinstance(other, MenuItem):
             return False
-        return self.id == other.id
+        return self._id is other._id or self._id == other._id
 
     def __hash__(self) -> int:
         """Return hash based on item ID."""
-        return hash(self.id)
\ No newline at end of file
+        return self._hash
\ No newline at end of file
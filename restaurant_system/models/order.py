@@ -5,15 +5,32 @@ This module defines the Order class that represents complete customer orders
 with comprehensive status tracking, customer information, and financial calculations.
 """
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import List, Optional, Dict, Any
+from functools import partial
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Mapping, Tuple
 from enum import Enum
 import uuid
 
 from .order_item import OrderItem
 from .menu_item import MenuItem
 
+# Current UTC time, with the timezone argument bound once
+_utc_now = partial(datetime.now, timezone.utc)
+
+# Shared read-only metadata for status changes recorded without any
+_EMPTY_METADATA = MappingProxyType({})
+
+
+def _to_basis_points(rate: Decimal) -> Optional[int]:
+    """Return the rate in basis points, or None if it needs finer precision."""
+    scaled = Decimal(rate) * 10000
+    if scaled != scaled.to_integral_value():
+        return None
+    return int(scaled)
+
 
 class OrderStatus(Enum):
     """Enumeration of possible order statuses."""
@@ -30,6 +47,45 @@ class OrderType(Enum):
     TAKEOUT = "takeout"
     DELIVERY = "delivery"
 
+    @property
+    def display(self) -> str:
+        """Get the human-readable name of the order type, e.g. 'Dine In'."""
+        return _ORDER_TYPE_DISPLAY[self]
+
+
+# Precomputed enum-to-string conversions used on the serialization paths
+_ORDER_STATUS_VALUE = {status: status.value for status in OrderStatus}
+_ORDER_TYPE_VALUE = {order_type: order_type.value for order_type in OrderType}
+_ORDER_TYPE_DISPLAY = {
+    order_type: order_type.value.replace('_', ' ').title() for order_type in OrderType
+}
+_ORDER_STATUS_TITLE = {status: status.value.title() for status in OrderStatus}
+
+
+@dataclass(frozen=True)
+class StatusChange:
+    """A single entry in an order's status history."""
+    __slots__ = ('timestamp', 'old_status', 'new_status', 'metadata')
+
+    timestamp: datetime
+    old_status: Optional[str]
+    new_status: str
+    metadata: Mapping[str, Any]
+
+    def to_dict(self) -> dict:
+        """
+        Convert the status change to a JSON-friendly dictionary.
+
+        Returns:
+            dict: Status change with an ISO formatted timestamp
+        """
+        return {
+            'timestamp': self.timestamp.isoformat(),
+            'old_status': self.old_status,
+            'new_status': self.new_status,
+            'metadata': dict(self.metadata)
+        }
+
 
 class Order:
     """
@@ -39,6 +95,13 @@ class Order:
     information, status tracking, and comprehensive financial calculations.
     """
 
+    __slots__ = (
+        '_order_id', '_timestamp', '_items', '_status', '_status_history',
+        'customer_name', 'customer_phone', 'table_number', 'order_type',
+        '_tax_rate', '_tax_rate_bp', '_is_priority', '_notes',
+        '_item_count_cache', '_item_index'
+    )
+
     # Default tax rate (configurable)
     DEFAULT_TAX_RATE = Decimal('0.08')  # 8%
 
@@ -56,11 +119,18 @@ class Order:
             order_id (str, optional): Unique identifier (auto-generated if not provided)
             tax_rate (Decimal, optional): Tax rate to apply (default DEFAULT_TAX_RATE)
         """
-        self._order_id = order_id or self._generate_order_id()
-        self._timestamp = datetime.now(timezone.utc)
+        # Generated on first access, so throwaway orders never pay for it
+        self._order_id = order_id or None
+        self._timestamp = _utc_now()
         self._items: List[OrderItem] = []
+        # Items keyed by (menu item ID, normalized instructions)
+        self._item_index: Dict[Tuple[str, str], OrderItem] = {}
         self._status = OrderStatus.PENDING
-        self._status_history: List[Dict[str, Any]] = []
+        self._status_history: List[StatusChange] = []
+
+        # Running item count, kept in step with the items list; the subtotal
+        # is derived from the items since menu prices can change
+        self._item_count_cache = 0
 
         # Customer information
         self.customer_name = customer_name
@@ -70,6 +140,7 @@ class Order:
 
         # Financial settings
         self._tax_rate = tax_rate or self.DEFAULT_TAX_RATE
+        self._tax_rate_bp = _to_basis_points(self._tax_rate)
 
         # Priority and notes
         self._is_priority = False
@@ -79,15 +150,18 @@ class Order:
         self._add_status_change(OrderStatus.PENDING)
 
     @staticmethod
-    def _generate_order_id() -> str:
-        """Generate a unique order ID with timestamp prefix."""
-        timestamp = datetime.now().strftime("%Y%m%d%H%M")
-        unique_suffix = str(uuid.uuid4())[:8].upper()
-        return f"ORD-{timestamp}-{unique_suffix}"
+    def _generate_order_id(created: datetime) -> str:
+        """Generate a unique order ID prefixed with the local creation time."""
+        dt = created.astimezone()
+        unique_suffix = uuid.uuid4().hex[:8].upper()
+        return (f"ORD-{dt.year:04d}{dt.month:02d}{dt.day:02d}"
+                f"{dt.hour:02d}{dt.minute:02d}-{unique_suffix}")
 
     @property
     def order_id(self) -> str:
         """Get the unique order identifier."""
+        if self._order_id is None:
+            self._order_id = self._generate_order_id(self._timestamp)
         return self._order_id
 
     @property
@@ -96,9 +170,9 @@ class Order:
         return self._timestamp
 
     @property
-    def items(self) -> List[OrderItem]:
-        """Get a copy of the order items list."""
-        return self._items.copy()
+    def items(self) -> Tuple[OrderItem, ...]:
+        """Get a read-only snapshot of the order items."""
+        return tuple(self._items)
 
     @property
     def status(self) -> OrderStatus:
@@ -106,9 +180,9 @@ class Order:
         return self._status
 
     @property
-    def status_history(self) -> List[Dict[str, Any]]:
-        """Get the complete status change history."""
-        return self._status_history.copy()
+    def status_history(self) -> Tuple[StatusChange, ...]:
+        """Get a read-only snapshot of the status change history."""
+        return tuple(self._status_history)
 
     @property
     def tax_rate(self) -> Decimal:
@@ -129,6 +203,7 @@ class Order:
         if value < 0 or value > 1:
             raise ValueError("Tax rate must be between 0 and 1")
         self._tax_rate = value
+        self._tax_rate_bp = _to_basis_points(value)
 
     @property
     def is_priority(self) -> bool:
@@ -176,7 +251,10 @@ class Order:
             return existing_item
         else:
             new_item = OrderItem(menu_item, quantity, special_instructions)
+            new_item._order = self
             self._items.append(new_item)
+            self._item_index[(menu_item.id, new_item._normalized_instructions)] = new_item
+            self._item_count_cache += new_item.quantity
             return new_item
 
     def remove_item(self, order_item: OrderItem) -> bool:
@@ -190,11 +268,15 @@ class Order:
             bool: True if item was removed, False if not found
         """
         try:
-            self._items.remove(order_item)
-            return True
+            removed_item = self._items.pop(self._items.index(order_item))
         except ValueError:
             return False
 
+        removed_item._order = None
+        self._item_count_cache -= removed_item._quantity
+        self._rebuild_item_index()
+        return True
+
     def update_item_quantity(self, order_item: OrderItem, new_quantity: int) -> bool:
         """
         Update the quantity of an existing order item.
@@ -209,7 +291,8 @@ class Order:
         Raises:
             ValueError: If new_quantity is not positive
         """
-        if order_item in self._items:
+        # Items added to this order point back at it, so no list scan is needed
+        if order_item._order is self:
             if new_quantity <= 0:
                 return self.remove_item(order_item)
             else:
@@ -219,7 +302,11 @@ class Order:
 
     def clear_items(self) -> None:
         """Remove all items from the order."""
+        for item in self._items:
+            item._order = None
         self._items.clear()
+        self._item_index.clear()
+        self._item_count_cache = 0
 
     def update_status(self, new_status: OrderStatus) -> None:
         """
@@ -257,41 +344,79 @@ class Order:
                           old_status: Optional[OrderStatus] = None,
                           metadata: Optional[Dict[str, Any]] = None) -> None:
         """Record a status change in the history."""
-        change_record = {
-            "timestamp": datetime.now(timezone.utc),
-            "old_status": old_status.value if old_status else None,
-            "new_status": new_status.value,
-            "metadata": metadata or {}
-        }
-        self._status_history.append(change_record)
+        self._status_history.append(StatusChange(
+            _utc_now(),
+            _ORDER_STATUS_VALUE[old_status] if old_status else None,
+            _ORDER_STATUS_VALUE[new_status],
+            metadata or _EMPTY_METADATA
+        ))
+
+    def _item_quantity_changed(self, order_item: OrderItem, old_quantity: int) -> None:
+        """Adjust the running item count after an item's quantity changed."""
+        self._item_count_cache += order_item.quantity - old_quantity
+
+    def _subtotal_in_cents(self) -> int:
+        """Sum the items at their current menu prices, in integer cents."""
+        return sum(item._menu_item.price_cents * item._quantity for item in self._items)
+
+    def _item_instructions_changed(self, order_item: OrderItem, old_normalized: str) -> None:
+        """Re-key an item in the index after its instructions changed."""
+        old_key = (order_item.item_id, old_normalized)
+        if self._item_index.get(old_key) is order_item:
+            del self._item_index[old_key]
+        new_key = (order_item.item_id, order_item._normalized_instructions)
+        self._item_index.setdefault(new_key, order_item)
+
+    def _rebuild_item_index(self) -> None:
+        """Rebuild the item index from the items list."""
+        self._item_index.clear()
+        for item in self._items:
+            self._item_index.setdefault((item.item_id, item._normalized_instructions), item)
+
+    @staticmethod
+    def _item_key(menu_item_id: str, special_instructions: str) -> Tuple[str, str]:
+        """Build the index key for a menu item and its instructions."""
+        return (menu_item_id, special_instructions.strip().lower())
 
     def _find_matching_item(self, menu_item: MenuItem,
                            special_instructions: str = "") -> Optional[OrderItem]:
         """Find an existing order item that matches the menu item and instructions."""
-        for item in self._items:
-            if item.is_same_item(menu_item, special_instructions):
-                return item
-        return None
+        return self._item_index.get(self._item_key(menu_item.id, special_instructions))
 
     @property
     def subtotal(self) -> Decimal:
-        """Calculate the subtotal of all items in the order."""
-        return sum(item.subtotal for item in self._items)
+        """Get the subtotal of all items in the order."""
+        return Decimal(self._subtotal_in_cents()).scaleb(-2)
 
     @property
     def tax_amount(self) -> Decimal:
         """Calculate the tax amount for the order."""
-        return (self.subtotal * self._tax_rate).quantize(Decimal('0.01'))
+        return self._calculate_totals()[1]
 
     @property
     def total_amount(self) -> Decimal:
         """Calculate the total amount including tax."""
-        return self.subtotal + self.tax_amount
+        return self._calculate_totals()[2]
+
+    def _calculate_totals(self) -> Tuple[Decimal, Decimal, Decimal]:
+        """Calculate subtotal, tax amount and total amount in one go."""
+        subtotal_cents = self._subtotal_in_cents()
+        subtotal = Decimal(subtotal_cents).scaleb(-2)
+        tax_rate_bp = self._tax_rate_bp
+        if tax_rate_bp is not None:
+            # Integer cents, rounding half to even like Decimal.quantize
+            tax_cents, remainder = divmod(subtotal_cents * tax_rate_bp, 10000)
+            if remainder > 5000 or (remainder == 5000 and tax_cents % 2):
+                tax_cents += 1
+            tax_amount = Decimal(tax_cents).scaleb(-2)
+        else:
+            tax_amount = (subtotal * self._tax_rate).quantize(Decimal('0.01'))
+        return subtotal, tax_amount, subtotal + tax_amount
 
     @property
     def item_count(self) -> int:
         """Get the total number of items in the order."""
-        return sum(item.quantity for item in self._items)
+        return self._item_count_cache
 
     @property
     def is_empty(self) -> bool:
@@ -305,12 +430,9 @@ class Order:
         Returns:
             Dict[str, List[OrderItem]]: Items grouped by category
         """
-        categories = {}
+        categories: Dict[str, List[OrderItem]] = {}
         for item in self._items:
-            category = item.item_category
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(item)
+            categories.setdefault(item.item_category, []).append(item)
         return categories
 
     def get_preparation_time_estimate(self) -> int:
@@ -320,18 +442,46 @@ class Order:
         Returns:
             int: Estimated preparation time in minutes
         """
-        # Basic estimation logic (can be enhanced based on item types)
-        base_time = 5  # Base preparation time
-        item_time = len(self._items) * 2  # 2 minutes per unique item
-        quantity_time = self.item_count * 0.5  # 30 seconds per item quantity
+        return self._estimate_preparation_time(
+            len(self._items), self._item_count_cache, self._is_priority
+        )
+
+    @staticmethod
+    def batch_preparation_time_estimates(orders: List['Order']) -> List[int]:
+        """
+        Estimate preparation times for many orders in one pass.
 
-        total_time = base_time + item_time + quantity_time
+        Args:
+            orders (List[Order]): Orders to estimate, e.g. the kitchen queue
 
-        # Add priority adjustment
-        if self.is_priority:
-            total_time *= 0.8  # Reduce time for priority orders
+        Returns:
+            List[int]: Estimated preparation time in minutes for each order
+        """
+        estimate = Order._estimate_preparation_time
+        return [
+            estimate(len(order._items), order._item_count_cache, order._is_priority)
+            for order in orders
+        ]
 
-        return max(5, int(total_time))  # Minimum 5 minutes
+    @staticmethod
+    def _estimate_preparation_time(unique_items: int, item_count: int,
+                                   is_priority: bool) -> int:
+        """Estimate preparation time in minutes from the order's item counts."""
+        # Basic estimation logic (can be enhanced based on item types),
+        # counted in half-minutes so everything stays in integer math
+        base_time = 10  # 5 minutes base preparation time
+        item_time = unique_items * 4  # 2 minutes per unique item
+        quantity_time = item_count  # 30 seconds per item quantity
+
+        half_minutes = base_time + item_time + quantity_time
+
+        # Priority orders take 80% of the time: x 0.8 / 2 == x * 2 // 5
+        if is_priority:
+            minutes = half_minutes * 2 // 5
+        else:
+            minutes = half_minutes // 2
+
+        return max(5, minutes)  # Minimum 5 minutes
 
     def to_dict(self) -> dict:
         """
@@ -341,33 +491,46 @@ class Order:
             dict: Dictionary containing all order properties
         """
         # Serialize status history with datetime conversion
-        serialized_history = []
-        for entry in self._status_history:
-            serialized_entry = entry.copy()
-            if 'timestamp' in serialized_entry and hasattr(serialized_entry['timestamp'], 'isoformat'):
-                serialized_entry['timestamp'] = serialized_entry['timestamp'].isoformat()
-            serialized_history.append(serialized_entry)
+        serialized_history = [change.to_dict() for change in self._status_history]
+
+        order_id = self.order_id
+        timestamp = self._timestamp.isoformat()
+        subtotal, tax_amount, total_amount = self._calculate_totals()
 
         return {
-            'id': self.order_id,  # Use 'id' for consistency with frontend
-            'order_id': self.order_id,
-            'created_at': self.timestamp.isoformat(),
-            'timestamp': self.timestamp.isoformat(),
+            'id': order_id,  # Use 'id' for consistency with frontend
+            'order_id': order_id,
+            'created_at': timestamp,
+            'timestamp': timestamp,
             'customer_name': self.customer_name,
             'customer_phone': self.customer_phone,
             'table_number': self.table_number,
-            'order_type': self.order_type.value,
-            'status': self.status.value,
+            'order_type': _ORDER_TYPE_VALUE[self.order_type],
+            'status': _ORDER_STATUS_VALUE[self._status],
             'is_priority': self.is_priority,
             'notes': self.notes,
             'tax_rate': float(self.tax_rate),
             'items': [item.to_dict() for item in self._items],
-            'subtotal': float(self.subtotal),
-            'tax_amount': float(self.tax_amount),
-            'total_amount': float(self.total_amount),
+            'subtotal': float(subtotal),
+            'tax_amount': float(tax_amount),
+            'total_amount': float(total_amount),
             'status_history': serialized_history
         }
 
+    @staticmethod
+    def bulk_to_dict(orders: List['Order']) -> List[dict]:
+        """
+        Convert many orders to dictionaries, e.g. for listings and backups.
+
+        Args:
+            orders (List[Order]): Orders to convert
+
+        Returns:
+            List[dict]: Dictionary representation of each order
+        """
+        to_dict = Order.to_dict
+        return [to_dict(order) for order in orders]
+
     def get_receipt_data(self) -> dict:
         """
         Get formatted data for receipt generation.
@@ -375,41 +538,44 @@ class Order:
         Returns:
             dict: Receipt-ready data
         """
+        subtotal, tax_amount, total_amount = self._calculate_totals()
+
         return {
             'order_id': self.order_id,
             'timestamp': self.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
             'customer_name': self.customer_name or "Guest",
             'customer_phone': self.customer_phone,
             'table_number': self.table_number,
-            'order_type': self.order_type.value.replace('_', ' ').title(),
-            'items': [
-                {
-                    'name': item.item_name,
-                    'quantity': item.quantity,
-                    'unit_price': float(item.unit_price),
-                    'subtotal': float(item.subtotal),
-                    'special_instructions': item.special_instructions
-                }
-                for item in self._items
-            ],
-            'subtotal': float(self.subtotal),
+            'order_type': self.order_type.display,
+            'items': [item.to_receipt_row() for item in self._items],
+            'subtotal': float(subtotal),
             'tax_rate': float(self.tax_rate * 100),  # Convert to percentage
-            'tax_amount': float(self.tax_amount),
-            'total_amount': float(self.total_amount),
-            'item_count': self.item_count
+            'tax_amount': float(tax_amount),
+            'total_amount': float(total_amount),
+            'item_count': self._item_count_cache
         }
 
     def __str__(self) -> str:
         """Return string representation of the order."""
-        status_display = self.status.value.title()
+        status_display = _ORDER_STATUS_TITLE[self._status]
         customer_info = self.customer_name or "Guest"
         return f"Order {self.order_id} - {customer_info} - {status_display} - ${self.total_amount:.2f}"
 
     def __repr__(self) -> str:
         """Return detailed string representation for debugging."""
-        return (f"Order(order_id='{self.order_id}', status={self.status.value}, "
+        return (f"Order(order_id='{self.order_id}', status={_ORDER_STATUS_VALUE[self._status]}, "
                 f"items={len(self._items)}, total=${self.total_amount})")
 
     def __len__(self) -> int:
         """Return the number of items in the order."""
-        return len(self._items)
\ No newline at end of file
+        return len(self._items)
+
+    def __eq__(self, other) -> bool:
+        """Check equality based on order ID."""
+        if not isinstance(other, Order):
+            return False
+        return self.order_id == other.order_id
+
+    def __hash__(self) -> int:
+        """Return hash based on order ID."""
+        return hash(self.order_id)
\ No newline at end of file
@@ -18,6 +18,9 @@ class OrderItem:
     providing automatic subtotal calculations and comprehensive data management.
     """
 
+    __slots__ = ('_menu_item', '_order', '_quantity', '_special_instructions',
+                 '_normalized_instructions')
+
     def __init__(self, menu_item: MenuItem, quantity: int = 1,
                  special_instructions: str = ""):
         """
@@ -36,6 +39,8 @@ class OrderItem:
             raise TypeError("menu_item must be a MenuItem instance")
 
         self._menu_item = menu_item
+        # Order that owns this item; notified of quantity and instruction changes
+        self._order = None
         self.quantity = quantity
         self.special_instructions = special_instructions
 
@@ -65,7 +70,12 @@ class OrderItem:
             raise TypeError("Quantity must be an integer")
         if value <= 0:
             raise ValueError("Quantity must be positive")
-        self._quantity = value
+        if self._order is not None:
+            old_quantity = self._quantity
+            self._quantity = value
+            self._order._item_quantity_changed(self, old_quantity)
+        else:
+            self._quantity = value
 
     @property
     def special_instructions(self) -> str:
@@ -75,13 +85,27 @@ class OrderItem:
     @special_instructions.setter
     def special_instructions(self, value: str) -> None:
         """Set the special instructions for this item."""
-        self._special_instructions = value.strip() if value else ""
+        instructions = value.strip() if value else ""
+        if self._order is not None:
+            old_normalized = self._normalized_instructions
+            self._special_instructions = instructions
+            self._normalized_instructions = instructions.lower()
+            self._order._item_instructions_changed(self, old_normalized)
+        else:
+            self._special_instructions = instructions
+            # Case-insensitive form used for matching and hashing
+            self._normalized_instructions = instructions.lower()
 
     @property
     def unit_price(self) -> Decimal:
         """Get the unit price from the associated menu item."""
         return self.menu_item.price
 
+    @property
+    def subtotal_cents(self) -> int:
+        """Get the subtotal for this order item in integer cents."""
+        return self._menu_item.price_cents * self._quantity
+
     @property
     def subtotal(self) -> Decimal:
         """
@@ -90,7 +114,7 @@ class OrderItem:
         Returns:
             Decimal: Quantity multiplied by unit price
         """
-        return self.unit_price * Decimal(str(self.quantity))
+        return Decimal(self.subtotal_cents).scaleb(-2)
 
     @property
     def item_name(self) -> str:
@@ -146,10 +170,27 @@ class OrderItem:
             'menu_item_id': self.menu_item.id,
             'menu_item_name': self.menu_item.name,
             'menu_item_category': self.menu_item.category,
-            'unit_price': float(self.unit_price),
+            'unit_price': self.menu_item.price_cents / 100,
             'quantity': self.quantity,
             'special_instructions': self.special_instructions,
-            'subtotal': float(self.subtotal)
+            'subtotal': self.subtotal_cents / 100
+        }
+
+    def to_receipt_row(self) -> dict:
+        """
+        Convert the OrderItem to a receipt line.
+
+        Returns:
+            dict: Name, quantity, prices and instructions for the receipt
+        """
+        price_cents = self._menu_item.price_cents
+        quantity = self._quantity
+        return {
+            'name': self._menu_item.name,
+            'quantity': quantity,
+            'unit_price': price_cents / 100,
+            'subtotal': price_cents * quantity / 100,
+            'special_instructions': self._special_instructions
         }
 
     @classmethod
@@ -199,9 +240,8 @@ class OrderItem:
         Returns:
             bool: True if menu item and instructions match
         """
-        return (self.menu_item == other_menu_item and
-                self.special_instructions.lower().strip() ==
-                other_instructions.lower().strip())
+        return ((self._menu_item is other_menu_item or self._menu_item == other_menu_item) and
+                self._normalized_instructions == other_instructions.strip().lower())
 
     def __str__(self) -> str:
         """Return string representation of the order item."""
@@ -213,12 +253,12 @@ class OrderItem:
                 f"quantity={self.quantity}, subtotal=${self.subtotal})")
 
     def __eq__(self, other) -> bool:
-        """Check equality based on menu item and special instructions."""
+        """Check equality based on menu item and normalized special instructions."""
         if not isinstance(other, OrderItem):
             return False
-        return (self.menu_item == other.menu_item and
-                self.special_instructions == other.special_instructions)
+        return ((self._menu_item is other._menu_item or self._menu_item == other._menu_item) and
+                self._normalized_instructions == other._normalized_instructions)
 
     def __hash__(self) -> int:
-        """Return hash based on menu item ID and special instructions."""
-        return hash((self.menu_item.id, self.special_instructions))
\ No newline at end of file
+        """Return hash based on menu item ID and normalized special instructions."""
+        return hash((self._menu_item.id, self._normalized_instructions))
\ No newline at end of file
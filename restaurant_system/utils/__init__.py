@@ -2,17 +2,28 @@
 Utilities package for Restaurant Order Management System.
 
 This package contains utility modules for data handling, validation,
-and receipt generation.
+and receipt generation. Submodules are imported on first attribute
+access so that consumers only pay for the utilities they use.
 """
 
-from .csv_handler import CSVHandler
-from .validators import InputValidator, ValidationError, DataIntegrityValidator
-from .receipt_generator import ReceiptGenerator
-
 __all__ = [
     'CSVHandler',
     'InputValidator',
     'ValidationError',
     'DataIntegrityValidator',
     'ReceiptGenerator'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import the requested utility lazily on first access."""
+    if name == 'CSVHandler':
+        from .csv_handler import CSVHandler
+        return CSVHandler
+    if name in ('InputValidator', 'ValidationError', 'DataIntegrityValidator'):
+        from . import validators
+        return getattr(validators, name)
+    if name == 'ReceiptGenerator':
+        from .receipt_generator import ReceiptGenerator
+        return ReceiptGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
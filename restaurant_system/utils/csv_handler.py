@@ -7,15 +7,147 @@ with robust error handling and data validation.
 
 import os
 import csv
+import io
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 import shutil
+import tempfile
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Iterable, Sequence, Set, TextIO, Tuple
 from pathlib import Path
 import logging
 
 from ..models import MenuItem, Order, OrderItem, OrderStatus, OrderType
 
+# Read/write buffer size for data files; large buffers amortize syscalls
+_IO_BUFFER_SIZE = 1 << 20
+
+# Allow large fields such as item lists in legacy orders.csv files
+csv.field_size_limit(4 * 1024 * 1024)
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    _dumps = json.dumps
+    _loads = json.loads
+
+
+@lru_cache(maxsize=64)
+def _to_decimal(value: Any) -> Decimal:
+    """Convert a stored number to a shared Decimal instance."""
+    return Decimal(str(value))
+
+
+# Stored orders repeat a handful of enum values; memoize the lookups
+_order_type = lru_cache(maxsize=16)(OrderType)
+_order_status = lru_cache(maxsize=16)(OrderStatus)
+
+
+class _SalesJournal:
+    """
+    Buffered, append-only writer for the sales CSV file.
+
+    The buffer and file descriptor live here rather than on CSVHandler so
+    a ``weakref.finalize`` hook can flush and close them without keeping
+    the handler alive.
+    """
+
+    def __init__(self, path: Path, headers: List[str], batch_size: int):
+        """
+        Initialize an empty journal.
+
+        Args:
+            path (Path): Sales CSV file to append to
+            headers (List[str]): Column order, also written to a new file
+            batch_size (int): Number of buffered records that triggers a write
+        """
+        self.path = path
+        self.headers = headers
+        self.batch_size = batch_size
+        self.records: List[Dict[str, Any]] = []
+        self.lock = threading.Lock()
+        self.fd: Optional[int] = None
+        self.logger = logging.getLogger(__name__)
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Buffer a sales record."""
+        with self.lock:
+            self.records.append(record)
+
+    def flush(self, force: bool = False) -> bool:
+        """
+        Write buffered records to the sales file.
+
+        Args:
+            force (bool): Write pending records even if the batch is not full
+
+        Returns:
+            bool: True if successful (or nothing needed writing), False otherwise
+        """
+        with self.lock:
+            if not self.records:
+                return True
+            if not force and len(self.records) < self.batch_size:
+                return True
+
+            try:
+                if self.fd is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    # O_APPEND makes every write land at the current end of
+                    # file, even when several processes share the file
+                    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+                    self.fd = os.open(self.path, flags, 0o644)
+                sales_fd = self.fd
+                start_offset = os.lseek(sales_fd, 0, os.SEEK_END)
+
+                # Render the whole batch first so it reaches the file in
+                # a single append; a new, empty file gets the header too
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                if start_offset == 0:
+                    writer.writerow(self.headers)
+                writer.writerows(map(itemgetter(*self.headers), self.records))
+                payload = buffer.getvalue().encode('utf-8')
+
+                try:
+                    view = memoryview(payload)
+                    while view:
+                        written = os.write(sales_fd, view)
+                        view = view[written:]
+                    os.fsync(sales_fd)
+                except OSError:
+                    # The batch stays buffered for a retry, so drop whatever
+                    # part of it reached the file to avoid duplicate rows
+                    os.ftruncate(sales_fd, start_offset)
+                    raise
+
+                self.logger.info(f"Flushed {len(self.records)} sales records to {self.path}")
+                self.records.clear()
+                return True
+
+            except Exception as e:
+                self.logger.error(f"Failed to flush sales records: {e}")
+                return False
+
+    def close(self) -> None:
+        """Flush pending records and release the file descriptor."""
+        self.flush(force=True)
+        with self.lock:
+            if self.fd is not None:
+                os.close(self.fd)
+                self.fd = None
+
 
 class CSVHandler:
     """
@@ -25,6 +157,14 @@ class CSVHandler:
     with comprehensive error handling and backup functionality.
     """
 
+    # Number of buffered sales records that triggers a flush to disk
+    _SALES_BATCH = 32
+
+    _SALES_HEADERS = [
+        'date', 'order_id', 'customer_name', 'order_type', 'status',
+        'subtotal', 'tax_amount', 'total_amount', 'items_count'
+    ]
+
     def __init__(self, data_directory: str):
         """
         Initialize the CSV handler with data directory.
@@ -33,22 +173,37 @@ class CSVHandler:
             data_directory (str): Path to the data directory
         """
         self.data_dir = Path(data_directory)
-        self.data_dir.mkdir(parents=True, exist_ok=True)
 
         # Define file paths
         self.menu_file = self.data_dir / "menu_items.csv"
-        self.orders_file = self.data_dir / "orders.csv"
+        self.orders_file = self.data_dir / "orders.jsonl"
+        self.legacy_orders_file = self.data_dir / "orders.csv"
         self.sales_file = self.data_dir / "sales_reports.csv"
 
         # Backup directory
         self.backup_dir = self.data_dir / "backups"
-        self.backup_dir.mkdir(exist_ok=True)
+
+        # Directories are created on first use rather than up front
+        self._ensured_dirs: Set[Path] = set()
 
         # Initialize logger
         self.logger = logging.getLogger(__name__)
 
-        # Initialize CSV files if they don't exist
-        self._initialize_csv_files()
+        # Sales records waiting to be appended in one batch
+        self._sales = _SalesJournal(self.sales_file, self._SALES_HEADERS, self._SALES_BATCH)
+        # Flushes the journal when the handler is collected or at exit,
+        # without holding a reference to the handler
+        self._finalizer = weakref.finalize(self, self._sales.close)
+
+        # Loaded data keyed by the file signature it was read from
+        self._menu_cache: Optional[Tuple[Tuple[int, int], List[Tuple[Any, ...]]]] = None
+        self._sales_cache: Optional[Tuple[Tuple[int, int], List[Dict[str, Any]]]] = None
+
+        # Initialize CSV files if they don't exist; a missing data directory
+        # (and its files) is only created by the first write
+        if self.data_dir.is_dir():
+            self._ensured_dirs.add(self.data_dir)
+            self._initialize_csv_files()
 
     def _initialize_csv_files(self) -> None:
         """Initialize CSV files with headers if they don't exist."""
@@ -57,100 +212,349 @@ class CSVHandler:
             'id', 'name', 'category', 'price', 'description', 'is_available'
         ]
 
-        # Orders CSV headers
-        order_headers = [
-            'id', 'order_id', 'created_at', 'timestamp', 'customer_name', 'customer_phone',
-            'table_number', 'order_type', 'status', 'is_priority', 'notes',
-            'tax_rate', 'subtotal', 'tax_amount', 'total_amount', 'items_json'
-        ]
-
-        # Sales reports CSV headers
-        sales_headers = [
-            'date', 'order_id', 'customer_name', 'order_type', 'status',
-            'subtotal', 'tax_amount', 'total_amount', 'items_count'
-        ]
-
         # Initialize files with headers
         self._create_csv_if_not_exists(self.menu_file, menu_headers)
-        self._create_csv_if_not_exists(self.orders_file, order_headers)
-        self._create_csv_if_not_exists(self.sales_file, sales_headers)
+        self._create_csv_if_not_exists(self.sales_file, self._SALES_HEADERS)
+        self._initialize_orders_file()
+
+    def _ensure_dir(self, directory: Path) -> None:
+        """
+        Create a directory (and its parents) once per handler.
+
+        Args:
+            directory (Path): Directory that must exist
+        """
+        if directory in self._ensured_dirs:
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs.add(directory)
+
+    def _ensure_data_dir(self) -> None:
+        """Create the data directory and its initial files before the first write."""
+        if self.data_dir in self._ensured_dirs:
+            return
+        # Marked as ensured first, since initializing writes through here
+        self._ensure_dir(self.data_dir)
+        self._initialize_csv_files()
 
     def _create_csv_if_not_exists(self, file_path: Path, headers: List[str]) -> None:
         """Create CSV file with headers if it doesn't exist."""
-        if not file_path.exists():
+        self._ensure_dir(file_path.parent)
+        try:
+            with open(file_path, 'x', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                writer.writerow(headers)
+            self.logger.info(f"Created CSV file: {file_path}")
+        except FileExistsError:
+            pass
+        except Exception as e:
+            self.logger.error(f"Failed to create CSV file {file_path}: {e}")
+            raise
+
+    def _initialize_orders_file(self) -> None:
+        """
+        Create the orders JSONL file if it doesn't exist.
+
+        Orders saved by older versions in ``orders.csv`` (with the items
+        embedded as a JSON column) are converted once; the CSV file is
+        left in place untouched. If any row cannot be read or converted,
+        or the JSONL file cannot be written, no orders file is created so
+        the migration is retried on the next start.
+        """
+        if self.orders_file.exists():
+            return
+
+        if self.legacy_orders_file.exists():
+            def process_legacy_row(row: Dict[str, str]) -> Dict[str, Any]:
+                record = dict(row)
+                record['is_priority'] = row['is_priority'].lower() == 'true'
+                for field in ('tax_rate', 'subtotal', 'tax_amount', 'total_amount'):
+                    record[field] = float(row[field])
+                record['items'] = _loads(record.pop('items_json'))
+                return record
+
             try:
-                with open(file_path, 'w', newline='', encoding='utf-8') as file:
-                    writer = csv.writer(file)
-                    writer.writerow(headers)
-                self.logger.info(f"Created CSV file: {file_path}")
+                with open(self.legacy_orders_file, 'r', newline='', encoding='utf-8') as file:
+                    records = [process_legacy_row(row) for row in csv.DictReader(file)]
             except Exception as e:
-                self.logger.error(f"Failed to create CSV file {file_path}: {e}")
+                self.logger.error(f"Not migrating orders from {self.legacy_orders_file}: {e}")
+                return
+
+            if self.safe_write_jsonl(self.orders_file, records, backup=False):
+                self.logger.info(f"Migrated {len(records)} orders from {self.legacy_orders_file}")
+            else:
+                self.logger.error(f"Failed to migrate orders from {self.legacy_orders_file}")
+            return
+
+        try:
+            self._ensure_dir(self.orders_file.parent)
+            self.orders_file.touch()
+            self.logger.info(f"Created orders file: {self.orders_file}")
+        except Exception as e:
+            self.logger.error(f"Failed to create orders file {self.orders_file}: {e}")
+            raise
+
+    @staticmethod
+    def _fast_copy(src: Path, dst: Path, link: bool = False) -> None:
+        """
+        Copy a file while keeping the data inside the kernel where possible.
+
+        Tries a hard link (when ``link`` is set), then ``os.copy_file_range``
+        (which can reflink on copy-on-write filesystems), then
+        ``shutil.copyfile`` (which uses ``sendfile`` on Linux). Metadata is
+        copied afterwards so backups keep the source modification time.
+
+        Args:
+            src (Path): File to copy
+            dst (Path): Destination path
+            link (bool): Whether to try hard-linking first
+        """
+        if link:
+            # Link under a fresh name and rename it over ``dst``, so an
+            # existing backup is replaced rather than opened for writing
+            temp_link = dst.with_name(f"{dst.name}.{os.urandom(6).hex()}.tmp")
+            try:
+                os.link(src, temp_link)
+            except FileNotFoundError:
                 raise
+            except OSError:
+                pass
+            else:
+                try:
+                    os.replace(temp_link, dst)
+                finally:
+                    # rename() does nothing when both names already link
+                    # the same file, which leaves the temporary name behind
+                    try:
+                        os.unlink(temp_link)
+                    except FileNotFoundError:
+                        pass
+                return
+
+        # Copy into a new temporary file next to ``dst`` and rename it into
+        # place, so a partial copy is never left under the backup name
+        temp_fd, temp_name = tempfile.mkstemp(prefix=f"{dst.name}.", suffix='.tmp',
+                                              dir=dst.parent)
+        try:
+            copy_file_range = getattr(os, 'copy_file_range', None)
+            copied = False
+            with open(temp_fd, 'wb') as fdst:
+                if copy_file_range is not None:
+                    with open(src, 'rb') as fsrc:
+                        try:
+                            remaining = os.fstat(fsrc.fileno()).st_size
+                            while remaining > 0:
+                                sent = copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                                if sent == 0:
+                                    break
+                                remaining -= sent
+                            copied = remaining == 0
+                        except OSError:
+                            copied = False
+
+            if not copied:
+                shutil.copyfile(src, temp_name)
+            shutil.copystat(src, temp_name)
+            os.replace(temp_name, dst)
+        except BaseException:
+            try:
+                os.unlink(temp_name)
+            except FileNotFoundError:
+                pass
+            raise
 
-    def create_backup(self, file_path: Path) -> Optional[Path]:
+    def create_backup(self, file_path: Path, link: bool = False) -> Optional[Path]:
         """
         Create a backup of the specified file.
 
+        With ``link`` set, the backup is a hard link to the current file
+        instead of a copy. That is only safe for files that are replaced
+        by rename rather than modified in place, such as those written by
+        ``safe_write_csv``; copying is used if linking fails. Buffered
+        sales records are flushed before the sales file is backed up.
+
         Args:
             file_path (Path): Path to the file to backup
+            link (bool): Whether to try hard-linking before copying
 
         Returns:
             Optional[Path]: Path to the backup file, None if backup failed
         """
-        if not file_path.exists():
-            return None
+        if file_path == self.sales_file:
+            # Include sales records still waiting in the buffer
+            self.flush_sales(force=True)
 
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_name = f"{file_path.stem}_{timestamp}.csv"
+            backup_name = f"{file_path.stem}_{timestamp}{file_path.suffix}"
             backup_path = self.backup_dir / backup_name
 
-            shutil.copy2(file_path, backup_path)
+            self._ensure_dir(self.backup_dir)
+            self._fast_copy(file_path, backup_path, link)
             self.logger.info(f"Created backup: {backup_path}")
             return backup_path
+        except FileNotFoundError:
+            # Nothing to back up yet
+            return None
         except Exception as e:
             self.logger.error(f"Failed to create backup for {file_path}: {e}")
             return None
 
-    def safe_write_csv(self, file_path: Path, data: List[Dict[str, Any]],
-                      headers: List[str]) -> bool:
+    @staticmethod
+    def _file_signature(file_path: Path) -> Optional[Tuple[int, int]]:
         """
-        Safely write data to CSV file with backup and validation.
+        Get a cheap change signature for a file.
 
         Args:
-            file_path (Path): Path to the CSV file
-            data (List[Dict[str, Any]]): Data to write
-            headers (List[str]): CSV headers
+            file_path (Path): Path to the file
+
+        Returns:
+            Optional[Tuple[int, int]]: Modification time in nanoseconds and
+            size in bytes, None if the file cannot be stat'ed
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _fsync_directory(self, directory: Path) -> None:
+        """
+        Flush a directory entry update (such as a rename) to disk.
+
+        Args:
+            directory (Path): Directory whose metadata should be synced
+        """
+        if not hasattr(os, 'O_DIRECTORY'):
+            # Directories cannot be opened for fsync on Windows
+            return
+
+        dir_fd = os.open(str(directory), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def _write_atomically(self, file_path: Path, write_records: Callable[[TextIO], int],
+                          durable: bool, backup: bool) -> bool:
+        """
+        Write a file through a temporary file that replaces it by rename.
+
+        When ``durable`` is set, the temporary file is fsynced before the
+        rename and the parent directory after it, so a crash cannot leave
+        a truncated target behind.
+
+        Args:
+            file_path (Path): Path to the target file
+            write_records (Callable): Writes the contents to the open file
+                and returns the number of records written
+            durable (bool): Whether to fsync the file and its directory
+            backup (bool): Whether to keep a timestamped backup of the
+                previous file contents
 
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            # Create backup if file exists
-            if file_path.exists():
-                self.create_backup(file_path)
+            if file_path.parent == self.data_dir:
+                self._ensure_data_dir()
+            else:
+                self._ensure_dir(file_path.parent)
+
+            # Create backup if file exists; the file is replaced by rename
+            # below, so a hard link preserves the old contents without a copy
+            if backup:
+                self.create_backup(file_path, link=True)
 
             # Write to temporary file first
             temp_file = file_path.with_suffix('.tmp')
 
-            with open(temp_file, 'w', newline='', encoding='utf-8') as file:
-                writer = csv.DictWriter(file, fieldnames=headers)
-                writer.writeheader()
-                writer.writerows(data)
+            with open(temp_file, 'w', newline='', encoding='utf-8',
+                      buffering=_IO_BUFFER_SIZE) as file:
+                record_count = write_records(file)
+                if durable:
+                    file.flush()
+                    os.fsync(file.fileno())
 
             # Replace original file with temporary file
-            shutil.move(temp_file, file_path)
-            self.logger.info(f"Successfully wrote {len(data)} records to {file_path}")
+            os.replace(temp_file, file_path)
+            if durable:
+                self._fsync_directory(file_path.parent)
+            self.logger.info(f"Successfully wrote {record_count} records to {file_path}")
             return True
 
         except Exception as e:
-            self.logger.error(f"Failed to write CSV file {file_path}: {e}")
+            self.logger.error(f"Failed to write file {file_path}: {e}")
             # Clean up temporary file if it exists
-            temp_file = file_path.with_suffix('.tmp')
-            if temp_file.exists():
-                temp_file.unlink()
+            try:
+                file_path.with_suffix('.tmp').unlink()
+            except FileNotFoundError:
+                pass
             return False
 
+    def safe_write_csv(self, file_path: Path, data: Iterable[Dict[str, Any]],
+                      headers: List[str], durable: bool = True,
+                      backup: bool = True) -> bool:
+        """
+        Safely write data to CSV file with backup and validation.
+
+        Rows are consumed one at a time, so ``data`` may be a generator.
+        Each row must provide every header key; the values are plucked
+        into a tuple by a single ``itemgetter`` call per row.
+
+        Args:
+            file_path (Path): Path to the CSV file
+            data (Iterable[Dict[str, Any]]): Data to write
+            headers (List[str]): CSV headers
+            durable (bool): Whether to fsync the file and its directory
+            backup (bool): Whether to keep a timestamped backup of the
+                previous file contents
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        def write_rows(file: TextIO) -> int:
+            writer = csv.writer(file)
+            writer.writerow(headers)
+            if len(headers) == 1:
+                key = headers[0]
+                pluck = lambda row: (row[key],)
+            else:
+                pluck = itemgetter(*headers)
+            writerow = writer.writerow
+            record_count = 0
+            for record_count, row in enumerate(data, start=1):
+                writerow(pluck(row))
+            return record_count
+
+        return self._write_atomically(file_path, write_rows, durable, backup)
+
+    def safe_write_jsonl(self, file_path: Path, records: Iterable[Dict[str, Any]],
+                         durable: bool = True, backup: bool = True) -> bool:
+        """
+        Safely write records to a JSON Lines file, one object per line.
+
+        Args:
+            file_path (Path): Path to the JSONL file
+            records (Iterable[Dict[str, Any]]): Records to write
+            durable (bool): Whether to fsync the file and its directory
+            backup (bool): Whether to keep a timestamped backup of the
+                previous file contents
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        def write_lines(file: TextIO) -> int:
+            record_count = 0
+            write = file.write
+            for record in records:
+                write(_dumps(record))
+                write('\n')
+                record_count += 1
+            return record_count
+
+        return self._write_atomically(file_path, write_lines, durable, backup)
+
     def read_csv_safe(self, file_path: Path,
                      row_processor: Optional[Callable] = None) -> List[Dict[str, Any]]:
         """
@@ -165,12 +569,9 @@ class CSVHandler:
         """
         data = []
 
-        if not file_path.exists():
-            self.logger.warning(f"CSV file does not exist: {file_path}")
-            return data
-
         try:
-            with open(file_path, 'r', newline='', encoding='utf-8') as file:
+            with open(file_path, 'r', newline='', encoding='utf-8',
+                      buffering=_IO_BUFFER_SIZE) as file:
                 reader = csv.DictReader(file)
                 for row_num, row in enumerate(reader, start=2):  # Start at 2 (after header)
                     try:
@@ -187,61 +588,143 @@ class CSVHandler:
             self.logger.info(f"Successfully read {len(data)} records from {file_path}")
             return data
 
+        except FileNotFoundError:
+            self.logger.warning(f"CSV file does not exist: {file_path}")
+            return []
         except Exception as e:
             self.logger.error(f"Failed to read CSV file {file_path}: {e}")
             return []
 
-    def save_menu_items(self, menu_items: List[MenuItem]) -> bool:
+    def _read_csv_columns(self, file_path: Path, columns: Sequence[str],
+                          row_processor: Callable[..., Any],
+                          filter_column: Optional[str] = None,
+                          keep: Optional[Callable[[str], bool]] = None) -> List[Any]:
+        """
+        Read selected CSV columns positionally and process each row.
+
+        The header is resolved to column indexes once, so each row is
+        plucked into a tuple by a single ``itemgetter`` call instead of
+        being materialized as a dictionary.
+
+        Args:
+            file_path (Path): Path to the CSV file
+            columns (Sequence[str]): Column names to extract, in order
+            row_processor (Callable): Called with one positional argument
+                per column; rows for which it returns None are skipped
+            filter_column (str, optional): Column tested by ``keep``
+            keep (Callable, optional): Predicate on the raw ``filter_column``
+                text; rejected rows are skipped before any other work
+
+        Returns:
+            List[Any]: Processed rows
+        """
+        data = []
+
+        try:
+            with open(file_path, 'r', newline='', encoding='utf-8',
+                      buffering=_IO_BUFFER_SIZE) as file:
+                reader = csv.reader(file)
+                header = next(reader, None)
+                if header is None:
+                    return data
+
+                index = {name: position for position, name in enumerate(header)}
+                missing = [name for name in columns if name not in index]
+                if missing:
+                    self.logger.warning(f"Missing columns {missing} in {file_path}")
+                    return data
+
+                if keep is not None and filter_column not in index:
+                    self.logger.warning(f"Missing column {filter_column} in {file_path}")
+                    return data
+
+                pluck = itemgetter(*(index[name] for name in columns))
+                filter_index = index[filter_column] if keep is not None else None
+                append = data.append
+                for row_num, row in enumerate(reader, start=2):  # Start at 2 (after header)
+                    if not row:
+                        continue
+                    try:
+                        if keep is not None and not keep(row[filter_index]):
+                            continue
+                        processed_row = row_processor(*pluck(row))
+                    except Exception as e:
+                        self.logger.warning(f"Error processing row {row_num} in {file_path}: {e}")
+                        continue
+                    if processed_row is not None:
+                        append(processed_row)
+
+            self.logger.info(f"Successfully read {len(data)} records from {file_path}")
+            return data
+
+        except FileNotFoundError:
+            self.logger.warning(f"CSV file does not exist: {file_path}")
+            return []
+        except Exception as e:
+            self.logger.error(f"Failed to read CSV file {file_path}: {e}")
+            return []
+
+    def save_menu_items(self, menu_items: List[MenuItem], durable: bool = True) -> bool:
         """
         Save menu items to CSV file.
 
         Args:
             menu_items (List[MenuItem]): List of menu items to save
+            durable (bool): Whether to fsync the written file
 
         Returns:
             bool: True if successful, False otherwise
         """
         headers = ['id', 'name', 'category', 'price', 'description', 'is_available']
-        data = [item.to_dict() for item in menu_items]
-        return self.safe_write_csv(self.menu_file, data, headers)
+        data = (item.to_dict() for item in menu_items)
+        self._menu_cache = None
+        return self.safe_write_csv(self.menu_file, data, headers, durable)
 
     def load_menu_items(self) -> List[MenuItem]:
         """
         Load menu items from CSV file.
 
+        The parsed rows are cached as long as the file's modification time
+        and size are unchanged. Fresh MenuItem objects are built from them
+        on every call, since callers edit the returned items in place.
+
         Returns:
             List[MenuItem]: List of loaded menu items
         """
-        def process_menu_row(row: Dict[str, str]) -> Optional[Dict[str, Any]]:
-            try:
-                return {
-                    'id': row['id'],
-                    'name': row['name'],
-                    'category': row['category'],
-                    'price': float(row['price']),
-                    'description': row['description'],
-                    'is_available': row['is_available'].lower() == 'true'
-                }
-            except (ValueError, KeyError) as e:
-                self.logger.warning(f"Invalid menu item row: {e}")
-                return None
-
-        data = self.read_csv_safe(self.menu_file, process_menu_row)
-        menu_items = []
-
-        for item_data in data:
-            try:
-                menu_item = MenuItem.from_dict(item_data)
-                menu_items.append(menu_item)
-            except Exception as e:
-                self.logger.warning(f"Failed to create MenuItem from data: {e}")
-                continue
-
+        signature = self._file_signature(self.menu_file)
+        cache = self._menu_cache
+        if signature is not None and cache is not None and cache[0] == signature:
+            return [MenuItem(*row) for row in cache[1]]
+
+        def process_menu_row(item_id: str, name: str, category: str, price: str,
+                             description: str, is_available: str) -> MenuItem:
+            return MenuItem(
+                name=name,
+                category=category,
+                price=float(price),
+                description=description,
+                is_available=is_available.lower() == 'true',
+                item_id=item_id
+            )
+
+        menu_items = self._read_csv_columns(
+            self.menu_file,
+            ('id', 'name', 'category', 'price', 'description', 'is_available'),
+            process_menu_row
+        )
+
+        if signature is not None:
+            # Validated constructor arguments, in MenuItem's positional order
+            self._menu_cache = (signature, [
+                (item.name, item.category, item.price, item.description,
+                 item.id, item.is_available)
+                for item in menu_items
+            ])
         return menu_items
 
     def save_orders(self, orders: List[Order]) -> bool:
         """
-        Save orders to CSV file.
+        Save orders to the JSON Lines orders file.
 
         Args:
             orders (List[Order]): List of orders to save
@@ -249,59 +732,56 @@ class CSVHandler:
         Returns:
             bool: True if successful, False otherwise
         """
-        import json
+        return self.safe_write_jsonl(self.orders_file, (order.to_dict() for order in orders))
 
-        headers = [
-            'id', 'order_id', 'created_at', 'timestamp', 'customer_name', 'customer_phone',
-            'table_number', 'order_type', 'status', 'is_priority', 'notes',
-            'tax_rate', 'subtotal', 'tax_amount', 'total_amount', 'items_json'
-        ]
+    def _read_jsonl(self, file_path: Path) -> List[Dict[str, Any]]:
+        """
+        Read a JSON Lines file, skipping blank and malformed lines.
+
+        Args:
+            file_path (Path): Path to the JSONL file
 
+        Returns:
+            List[Dict[str, Any]]: Decoded records
+        """
         data = []
-        for order in orders:
-            order_dict = order.to_dict()
-            # Convert items to JSON string for CSV storage
-            order_dict['items_json'] = json.dumps(order_dict['items'])
-            del order_dict['items']  # Remove the original items list
-            del order_dict['status_history']  # Remove status history for CSV
-            data.append(order_dict)
 
-        return self.safe_write_csv(self.orders_file, data, headers)
+        try:
+            with open(file_path, 'r', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as file:
+                loads = _loads
+                append = data.append
+                for line_num, line in enumerate(file, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        append(loads(line))
+                    except ValueError as e:
+                        self.logger.warning(f"Error processing line {line_num} in {file_path}: {e}")
 
-    def load_orders(self, menu_items_dict: Dict[str, MenuItem]) -> List[Order]:
+            self.logger.info(f"Successfully read {len(data)} records from {file_path}")
+            return data
+
+        except FileNotFoundError:
+            self.logger.warning(f"JSONL file does not exist: {file_path}")
+            return []
+        except Exception as e:
+            self.logger.error(f"Failed to read JSONL file {file_path}: {e}")
+            return []
+
+    def load_orders(self, menu_resolver: Callable[[str], Optional[MenuItem]]) -> List[Order]:
         """
-        Load orders from CSV file.
+        Load orders from the JSON Lines orders file.
 
         Args:
-            menu_items_dict (Dict[str, MenuItem]): Dictionary of menu items by ID
+            menu_resolver (Callable[[str], Optional[MenuItem]]): Looks up a
+                menu item by ID, returning None for unknown IDs; typically
+                ``menu_items_dict.get``
 
         Returns:
             List[Order]: List of loaded orders
         """
-        import json
-
-        def process_order_row(row: Dict[str, str]) -> Optional[Dict[str, Any]]:
-            try:
-                return {
-                    'id': row.get('id', ''),
-                    'order_id': row['order_id'],
-                    'created_at': row.get('created_at', row.get('timestamp', '')),
-                    'timestamp': row['timestamp'],
-                    'customer_name': row['customer_name'],
-                    'customer_phone': row['customer_phone'],
-                    'table_number': row['table_number'],
-                    'order_type': row['order_type'],
-                    'status': row['status'],
-                    'is_priority': row['is_priority'].lower() == 'true',
-                    'notes': row['notes'],
-                    'tax_rate': Decimal(row['tax_rate']),
-                    'items_json': row['items_json']
-                }
-            except (ValueError, KeyError) as e:
-                self.logger.warning(f"Invalid order row: {e}")
-                return None
-
-        data = self.read_csv_safe(self.orders_file, process_order_row)
+        data = self._read_jsonl(self.orders_file)
+        resolve = menu_resolver
         orders = []
 
         for order_data in data:
@@ -311,21 +791,19 @@ class CSVHandler:
                     customer_name=order_data['customer_name'],
                     customer_phone=order_data['customer_phone'],
                     table_number=order_data['table_number'],
-                    order_type=OrderType(order_data['order_type']),
+                    order_type=_order_type(order_data['order_type']),
                     order_id=order_data['order_id']
                 )
 
                 # Set additional properties
                 order.is_priority = order_data['is_priority']
                 order.notes = order_data['notes']
-                order.tax_rate = order_data['tax_rate']
-
-                # Parse and add items
-                items_data = json.loads(order_data['items_json'])
-                for item_data in items_data:
-                    menu_item_id = item_data['menu_item_id']
-                    if menu_item_id in menu_items_dict:
-                        menu_item = menu_items_dict[menu_item_id]
+                order.tax_rate = _to_decimal(order_data['tax_rate'])
+
+                # Add items
+                for item_data in order_data['items']:
+                    menu_item = resolve(item_data['menu_item_id'])
+                    if menu_item is not None:
                         order.add_item(
                             menu_item,
                             item_data['quantity'],
@@ -333,7 +811,7 @@ class CSVHandler:
                         )
 
                 # Set order status
-                order.update_status(OrderStatus(order_data['status']))
+                order.update_status(_order_status(order_data['status']))
 
                 orders.append(order)
 
@@ -343,10 +821,38 @@ class CSVHandler:
 
         return orders
 
+    def load_all(self) -> Tuple[List[MenuItem], List[Order], List[Dict[str, Any]]]:
+        """
+        Load menu items, orders and sales data concurrently.
+
+        The three files are read on a small thread pool so their I/O
+        overlaps; orders wait for the menu since they resolve items
+        against it.
+
+        Returns:
+            Tuple[List[MenuItem], List[Order], List[Dict[str, Any]]]:
+            Menu items, orders and sales records
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            menu_future = executor.submit(self.load_menu_items)
+
+            def load_orders_after_menu() -> List[Order]:
+                menu_items_dict = {item.id: item for item in menu_future.result()}
+                return self.load_orders(menu_items_dict.get)
+
+            orders_future = executor.submit(load_orders_after_menu)
+            sales_future = executor.submit(self.load_sales_data)
+
+            return menu_future.result(), orders_future.result(), sales_future.result()
+
     def append_sales_record(self, order: Order) -> bool:
         """
         Append a sales record to the sales CSV file.
 
+        Records are buffered in memory and written in batches of
+        ``_SALES_BATCH``; call ``flush_sales(force=True)`` to write any
+        pending records immediately.
+
         Args:
             order (Order): Order to record as a sale
 
@@ -366,23 +872,45 @@ class CSVHandler:
                 'items_count': order.item_count
             }
 
-            # Append to sales file
-            with open(self.sales_file, 'a', newline='', encoding='utf-8') as file:
-                writer = csv.DictWriter(file, fieldnames=list(sales_data.keys()))
-                writer.writerow(sales_data)
+            self._sales.append(sales_data)
 
             self.logger.info(f"Added sales record for order {order.order_id}")
-            return True
+            return self.flush_sales()
 
         except Exception as e:
             self.logger.error(f"Failed to append sales record: {e}")
             return False
 
+    def flush_sales(self, force: bool = False) -> bool:
+        """
+        Write buffered sales records to the sales CSV file.
+
+        Args:
+            force (bool): Write pending records even if the batch is not full
+
+        Returns:
+            bool: True if successful (or nothing needed writing), False otherwise
+        """
+        pending = len(self._sales.records)
+        if self._sales.fd is None and pending and (force or pending >= self._SALES_BATCH):
+            # First write: create the data directory and its files
+            self._ensure_data_dir()
+        return self._sales.flush(force)
+
+    def close(self) -> None:
+        """Flush pending sales records and release the sales journal file."""
+        self._finalizer()
+
     def load_sales_data(self, start_date: Optional[str] = None,
                        end_date: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Load sales data with optional date filtering.
 
+        A full, unfiltered load is cached by file signature; later loads
+        (filtered or not) are served from it without re-parsing as long as
+        the file is unchanged. Callers always get their own record dicts,
+        so editing them never changes the cache.
+
         Args:
             start_date (str, optional): Start date in YYYY-MM-DD format
             end_date (str, optional): End date in YYYY-MM-DD format
@@ -390,32 +918,56 @@ class CSVHandler:
         Returns:
             List[Dict[str, Any]]: List of sales records
         """
-        def process_sales_row(row: Dict[str, str]) -> Optional[Dict[str, Any]]:
-            try:
-                record_date = row['date']
-
-                # Apply date filtering if specified
-                if start_date and record_date < start_date:
-                    return None
-                if end_date and record_date > end_date:
-                    return None
-
-                return {
-                    'date': record_date,
-                    'order_id': row['order_id'],
-                    'customer_name': row['customer_name'],
-                    'order_type': row['order_type'],
-                    'status': row['status'],
-                    'subtotal': float(row['subtotal']),
-                    'tax_amount': float(row['tax_amount']),
-                    'total_amount': float(row['total_amount']),
-                    'items_count': int(row['items_count'])
-                }
-            except (ValueError, KeyError) as e:
-                self.logger.warning(f"Invalid sales row: {e}")
-                return None
-
-        return self.read_csv_safe(self.sales_file, process_sales_row)
+        # Make sure records still in the buffer are visible to the reader
+        self.flush_sales(force=True)
+        signature = self._file_signature(self.sales_file)
+
+        # Build the date predicate once; it runs on the raw date text so
+        # rejected rows are never unpacked or converted
+        if start_date and end_date:
+            keep = lambda record_date: start_date <= record_date <= end_date
+        elif start_date:
+            keep = start_date.__le__
+        elif end_date:
+            keep = end_date.__ge__
+        else:
+            keep = None
+
+        cache = self._sales_cache
+        if signature is not None and cache is not None and cache[0] == signature:
+            if keep is None:
+                return [dict(record) for record in cache[1]]
+            return [dict(record) for record in cache[1] if keep(record['date'])]
+
+        def process_sales_row(record_date: str, order_id: str, customer_name: str,
+                              order_type: str, status: str, subtotal: str,
+                              tax_amount: str, total_amount: str,
+                              items_count: str) -> Dict[str, Any]:
+            return {
+                'date': record_date,
+                'order_id': order_id,
+                'customer_name': customer_name,
+                'order_type': order_type,
+                'status': status,
+                'subtotal': float(subtotal),
+                'tax_amount': float(tax_amount),
+                'total_amount': float(total_amount),
+                'items_count': int(items_count)
+            }
+
+        records = self._read_csv_columns(
+            self.sales_file,
+            ('date', 'order_id', 'customer_name', 'order_type', 'status',
+             'subtotal', 'tax_amount', 'total_amount', 'items_count'),
+            process_sales_row,
+            filter_column='date',
+            keep=keep
+        )
+
+        if keep is None and signature is not None:
+            self._sales_cache = (signature, records)
+            return [dict(record) for record in records]
+        return records
 
     def cleanup_old_backups(self, max_backups: int = 10) -> None:
         """
@@ -425,24 +977,33 @@ class CSVHandler:
             max_backups (int): Maximum number of backups to keep per file type
         """
         try:
-            backup_files = list(self.backup_dir.glob("*.csv"))
-
-            # Group backups by file type
+            # Group backups by source file; names look like
+            # "<stem>_YYYYMMDD_HHMMSS<suffix>", so the timestamp text sorts
+            # chronologically without stat'ing each file
             backup_groups = {}
-            for backup_file in backup_files:
-                file_type = backup_file.name.split('_')[0]  # Get prefix before timestamp
-                if file_type not in backup_groups:
-                    backup_groups[file_type] = []
-                backup_groups[file_type].append(backup_file)
+            with os.scandir(self.backup_dir) as entries:
+                for entry in entries:
+                    stem, dot, suffix = entry.name.rpartition('.')
+                    if not dot or suffix not in ('csv', 'jsonl'):
+                        continue
+                    parts = stem.rsplit('_', 2)
+                    if len(parts) != 3:
+                        continue
+                    file_type, date_part, time_part = parts
+                    backup_groups.setdefault(file_type, []).append(
+                        (date_part + time_part, entry.path)
+                    )
 
             # Sort and remove old backups for each file type
             for file_type, files in backup_groups.items():
-                files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-
                 if len(files) > max_backups:
-                    for old_file in files[max_backups:]:
-                        old_file.unlink()
+                    files.sort(reverse=True)
+                    for _, old_file in files[max_backups:]:
+                        os.unlink(old_file)
                         self.logger.info(f"Removed old backup: {old_file}")
 
+        except FileNotFoundError:
+            # No backup has been made yet
+            return
         except Exception as e:
             self.logger.error(f"Failed to cleanup old backups: {e}")
\ No newline at end of file
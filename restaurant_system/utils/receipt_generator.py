@@ -6,14 +6,238 @@ with professional formatting and multiple output options.
 """
 
 import os
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
+from html import escape
+from itertools import count
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 import logging
 
 from ..models import Order
 
 
+# Static parts of the HTML receipt, shared by every generated receipt
+_RECEIPT_HTML_HEAD = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Receipt - """
+
+_RECEIPT_CSS = """    <style>
+        body {
+            font-family: 'Courier New', monospace;
+            max-width: 400px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f9f9f9;
+        }
+        .receipt {
+            background-color: white;
+            padding: 20px;
+            border: 1px solid #ddd;
+            border-radius: 5px;
+        }
+        .header {
+            text-align: center;
+            border-bottom: 2px solid #333;
+            padding-bottom: 10px;
+            margin-bottom: 15px;
+        }
+        .restaurant-name {
+            font-size: 18px;
+            font-weight: bold;
+            margin-bottom: 5px;
+        }
+        .contact-info {
+            font-size: 12px;
+            color: #666;
+        }
+        .order-info {
+            margin-bottom: 15px;
+            border-bottom: 1px solid #ddd;
+            padding-bottom: 10px;
+        }
+        .items-table {
+            width: 100%;
+            border-collapse: collapse;
+            margin-bottom: 15px;
+        }
+        .items-table th, .items-table td {
+            text-align: left;
+            padding: 5px;
+            border-bottom: 1px solid #eee;
+        }
+        .items-table th {
+            background-color: #f5f5f5;
+            font-weight: bold;
+        }
+        .totals {
+            border-top: 2px solid #333;
+            padding-top: 10px;
+        }
+        .total-line {
+            display: flex;
+            justify-content: space-between;
+            margin: 5px 0;
+        }
+        .grand-total {
+            font-weight: bold;
+            border-top: 1px solid #333;
+            padding-top: 5px;
+            margin-top: 10px;
+        }
+        .footer {
+            text-align: center;
+            margin-top: 20px;
+            padding-top: 15px;
+            border-top: 1px solid #ddd;
+            color: #666;
+        }
+        .special-instructions {
+            font-style: italic;
+            color: #666;
+            font-size: 11px;
+        }
+    </style>
+"""
+
+# Per-item row patterns, kept as literal %-format strings for the hot loops
+_ITEM_HEADER_FMT = "%-20s %-4s %-8s %-8s"
+_ITEM_ROW_FMT = "%-20s %-4d $%-7.2f $%-7.2f"
+_INSTRUCTIONS_FMT = "  * %s"
+_ELLIPSIS = "..."
+
+_HTML_ITEM_FMT = """
+                <tr>
+                    <td>%s</td>
+                    <td>%s</td>
+                    <td>$%.2f</td>
+                    <td>$%.2f</td>
+                </tr>
+"""
+
+_HTML_INSTRUCTIONS_FMT = """
+                <tr>
+                    <td colspan="4" class="special-instructions">
+                        * %s
+                    </td>
+                </tr>
+"""
+
+# Order-dependent HTML around the item rows, filled with named %-references
+_HTML_ORDER_INFO_FMT = """
+
+        <!-- Order Info -->
+        <div class="order-info">
+            <strong>Order ID:</strong> %(order_id)s<br>
+            <strong>Order Time:</strong> %(timestamp)s<br>
+            %(customer_line)s
+            %(phone_line)s
+            %(table_line)s
+            <strong>Order Type:</strong> %(order_type)s
+        </div>
+
+        <!-- Items -->
+        <table class="items-table">
+            <thead>
+                <tr>
+                    <th>Item</th>
+                    <th>Qty</th>
+                    <th>Price</th>
+                    <th>Total</th>
+                </tr>
+            </thead>
+            <tbody>
+"""
+
+_HTML_TOTALS_FMT = """
+            </tbody>
+        </table>
+
+        <!-- Totals -->
+        <div class="totals">
+            <div class="total-line">
+                <span>Subtotal:</span>
+                <span>$%(subtotal).2f</span>
+            </div>
+            <div class="total-line">
+                <span>Tax (%(tax_rate).1f%%):</span>
+                <span>$%(tax_amount).2f</span>
+            </div>
+            <div class="total-line grand-total">
+                <span>TOTAL:</span>
+                <span>$%(total_amount).2f</span>
+            </div>
+            <div style="margin-top: 10px;">
+                <strong>Total Items:</strong> %(item_count)s
+            </div>
+        </div>
+
+        <!-- Footer -->
+        <div class="footer">
+            %(footer)s
+        </div>
+"""
+
+
+def _render_item_lines(items: List[Dict[str, Any]], lines: List[str]) -> None:
+    """
+    Append the text receipt lines for each item (and its instructions).
+
+    Kept as a module-level function working only on locals, since this is
+    the per-item hot loop of text receipt rendering.
+
+    Args:
+        items (List[Dict[str, Any]]): Receipt rows from ``Order.get_receipt_data``
+        lines (List[str]): Receipt lines to append to
+    """
+    # "$%-7.2f" pads the dollar amount to the same 8 columns as
+    # left-aligning the "$"-prefixed string would
+    append = lines.append
+    for item in items:
+        name = item['name']
+        if len(name) > 20:
+            name = name[:17] + _ELLIPSIS
+
+        append(_ITEM_ROW_FMT % (
+            name, item['quantity'], item['unit_price'], item['subtotal']
+        ))
+
+        # Add special instructions if present
+        instructions = item.get('special_instructions')
+        if instructions:
+            if len(instructions) > 40:
+                instructions = instructions[:37] + _ELLIPSIS
+            append(_INSTRUCTIONS_FMT % instructions)
+
+
+def _freeze_receipt_data(receipt_data: Dict[str, Any]) -> Tuple:
+    """
+    Canonicalize receipt data into a hashable key, independent of dict order.
+
+    Args:
+        receipt_data (Dict[str, Any]): Data from ``Order.get_receipt_data``
+
+    Returns:
+        Tuple: Sorted (key, value) pairs with the items frozen the same way
+    """
+    return tuple(sorted(
+        (key, tuple(tuple(sorted(item.items())) for item in value))
+        if key == 'items' else (key, value)
+        for key, value in receipt_data.items()
+    ))
+
+
+def _thaw_receipt_data(frozen: Tuple) -> Dict[str, Any]:
+    """Rebuild the receipt data dict from ``_freeze_receipt_data`` output."""
+    receipt_data = dict(frozen)
+    receipt_data['items'] = [dict(item) for item in receipt_data['items']]
+    return receipt_data
+
+
 class ReceiptGenerator:
     """
     Generates professional receipts for restaurant orders.
@@ -37,8 +261,24 @@ class ReceiptGenerator:
         self.separator_char = "-"
         self.double_separator_char = "="
 
-        # Receipt counter for numbering
-        self._receipt_counter = 1000
+        # Receipt counter for numbering; next() on a count is a single C call
+        self._receipt_counter = count(1001)
+
+        # "%y%m%d" prefix for receipt numbers, formatted once per calendar day
+        self._cached_day: Optional[date] = None
+        self._cached_day_str = ""
+
+        # Rendered order sections (everything below the receipt number and
+        # date) keyed by frozen receipt data, so reprints skip formatting
+        self._render_text_body = lru_cache(maxsize=256)(self._build_text_body)
+        self._render_html_body = lru_cache(maxsize=256)(self._build_html_body)
+
+        # Restaurant header blocks, rendered once per restaurant_info change
+        self._header_text_cache: List[str] = []
+        self._header_html_cache = ""
+        self._footer_text_cache: List[str] = []
+        self._footer_html_cache = ""
+        self._rebuild_header_caches()
 
     def _get_default_restaurant_info(self) -> Dict[str, str]:
         """Get default restaurant information."""
@@ -56,10 +296,73 @@ class ReceiptGenerator:
         """
         Update restaurant information.
 
+        Use this rather than mutating ``restaurant_info`` directly so the
+        cached receipt headers are re-rendered.
+
         Args:
             restaurant_info (Dict[str, str]): New restaurant details
         """
         self.restaurant_info.update(restaurant_info)
+        self._rebuild_header_caches()
+
+    def _rebuild_header_caches(self) -> None:
+        """Render the static restaurant header for text and HTML receipts."""
+        info = self.restaurant_info
+        self._sep_line = self.separator_char * self.width
+        self._render_text_body.cache_clear()
+        self._render_html_body.cache_clear()
+        self._dsep_line = self.double_separator_char * self.width
+
+        center = self._center_text
+        esc = escape
+        lines = []
+
+        # Restaurant name (centered)
+        name = info.get("name", "Restaurant").upper()
+        lines.append(center(name))
+
+        # Address and contact information (centered); the HTML block only
+        # gets a line for fields that are present and non-empty
+        contact_html = []
+        for key, label in (("address_line1", "%s"), ("address_line2", "%s"),
+                           ("phone", "Phone: %s"), ("email", "%s")):
+            value = info.get(key)
+            if value is None:
+                continue
+            lines.append(center(label % value))
+            if value:
+                contact_html.append(label % esc(value))
+
+        # Separator
+        lines.append(self._dsep_line)
+
+        self._header_text_cache = lines
+        contact_block = "<br>\n                ".join(contact_html)
+        self._header_html_cache = f"""        <div class="header">
+            <div class="restaurant-name">{esc(name)}</div>
+            <div class="contact-info">
+                {contact_block}
+            </div>
+        </div>"""
+
+        # Footer: thank-you lines plus tax ID and website when available
+        footer = ["", center("Thank you for your business!"), center("Please come again!")]
+        footer_html = ["<div>Thank you for your business!</div>", "<div>Please come again!</div>"]
+
+        tax_id = info.get("tax_id")
+        if tax_id is not None:
+            footer.append("")
+            footer.append(center(tax_id))
+        website = info.get("website")
+        if website is not None:
+            footer.append(center(website))
+
+        for value in (tax_id, website):
+            if value:
+                footer_html.append("<div>%s</div>" % esc(value))
+
+        self._footer_text_cache = footer
+        self._footer_html_cache = "\n            ".join(footer_html)
 
     def generate_receipt_text(self, order: Order, receipt_number: Optional[str] = None) -> str:
         """
@@ -73,182 +376,158 @@ class ReceiptGenerator:
             str: Formatted receipt text
         """
         try:
-            receipt_data = order.get_receipt_data()
+            frozen_data = _freeze_receipt_data(order.get_receipt_data())
             receipt_num = receipt_number or self._generate_receipt_number()
+            return self._compose_text(frozen_data, receipt_num)
 
-            lines = []
+        except Exception as e:
+            self.logger.error("Failed to generate receipt for order %s: %s", order.order_id, e)
+            return f"Error generating receipt: {e}"
 
-            # Header section
-            lines.extend(self._generate_header(receipt_num))
-            lines.append("")
+    def generate_receipt_text_and_html(self, order: Order,
+                                       receipt_number: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Generate the text and HTML receipts for an order in one pass.
 
-            # Order information
-            lines.extend(self._generate_order_info(receipt_data))
-            lines.append("")
+        The order's receipt data is collected once and both formats share
+        one receipt number, which suits printing and emailing the same
+        receipt.
 
-            # Items section
-            lines.extend(self._generate_items_section(receipt_data))
-            lines.append("")
+        Args:
+            order (Order): The order to generate receipts for
+            receipt_number (str, optional): Custom receipt number
 
-            # Totals section
-            lines.extend(self._generate_totals_section(receipt_data))
-            lines.append("")
+        Returns:
+            Tuple[str, str]: Formatted receipt text and HTML receipt
+        """
+        try:
+            frozen_data = _freeze_receipt_data(order.get_receipt_data())
+            receipt_num = receipt_number or self._generate_receipt_number()
+            return (self._compose_text(frozen_data, receipt_num),
+                    self._compose_html(frozen_data, receipt_num))
 
-            # Footer section
-            lines.extend(self._generate_footer())
+        except Exception as e:
+            self.logger.error("Failed to generate receipts for order %s: %s", order.order_id, e)
+            return (f"Error generating receipt: {e}",
+                    f"<html><body><h1>Error generating receipt: {e}</h1></body></html>")
+
+    def _compose_text(self, frozen_data: Tuple, receipt_num: str) -> str:
+        """Join the per-receipt text header with the cached order sections."""
+        lines: List[str] = []
+        self._append_header(lines, receipt_num)
+        lines.append("")
+        lines.append(self._render_text_body(frozen_data))
+        return "\n".join(lines)
 
-            return "\n".join(lines)
+    def _build_text_body(self, frozen_data: Tuple) -> str:
+        """
+        Render the text receipt below the header; cached per receipt data.
 
-        except Exception as e:
-            self.logger.error(f"Failed to generate receipt for order {order.order_id}: {e}")
-            return f"Error generating receipt: {e}"
+        Args:
+            frozen_data (Tuple): Receipt data from ``_freeze_receipt_data``
 
-    def _generate_header(self, receipt_number: str) -> List[str]:
-        """Generate the receipt header section."""
-        lines = []
+        Returns:
+            str: Order info, items, totals and footer sections
+        """
+        receipt_data = _thaw_receipt_data(frozen_data)
+        lines: List[str] = []
 
-        # Restaurant name (centered)
-        name = self.restaurant_info.get("name", "Restaurant")
-        lines.append(self._center_text(name.upper()))
+        # Order information
+        self._append_order_info(lines, receipt_data)
+        lines.append("")
 
-        # Address information (centered)
-        if "address_line1" in self.restaurant_info:
-            lines.append(self._center_text(self.restaurant_info["address_line1"]))
-        if "address_line2" in self.restaurant_info:
-            lines.append(self._center_text(self.restaurant_info["address_line2"]))
+        # Items section
+        self._append_items_section(lines, receipt_data)
+        lines.append("")
 
-        # Contact information (centered)
-        if "phone" in self.restaurant_info:
-            lines.append(self._center_text(f"Phone: {self.restaurant_info['phone']}"))
-        if "email" in self.restaurant_info:
-            lines.append(self._center_text(self.restaurant_info["email"]))
+        # Totals section
+        self._append_totals_section(lines, receipt_data)
+        lines.append("")
 
-        # Separator
-        lines.append(self.double_separator_char * self.width)
+        # Footer section
+        self._append_footer(lines)
 
-        # Receipt information
-        lines.append(f"Receipt #: {receipt_number}")
-        lines.append(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        return "\n".join(lines)
 
-        return lines
+    def _append_header(self, lines: List[str], receipt_number: str) -> None:
+        """Append the receipt header section."""
+        lines.extend(self._header_text_cache)
 
-    def _generate_order_info(self, receipt_data: Dict[str, Any]) -> List[str]:
-        """Generate the order information section."""
-        lines = []
+        # Receipt information
+        lines.append("Receipt #: %s" % receipt_number)
+        lines.append("Date: %s" % datetime.now().isoformat(sep=' ', timespec='seconds'))
+
+    def _append_order_info(self, lines: List[str], receipt_data: Dict[str, Any]) -> None:
+        """Append the order information section."""
+        append = lines.append
 
-        lines.append(f"Order ID: {receipt_data['order_id']}")
-        lines.append(f"Order Time: {receipt_data['timestamp']}")
+        append("Order ID: %s" % receipt_data['order_id'])
+        append("Order Time: %s" % receipt_data['timestamp'])
 
         if receipt_data.get('customer_name'):
-            lines.append(f"Customer: {receipt_data['customer_name']}")
+            append("Customer: %s" % receipt_data['customer_name'])
 
         if receipt_data.get('customer_phone'):
-            lines.append(f"Phone: {receipt_data['customer_phone']}")
+            append("Phone: %s" % receipt_data['customer_phone'])
 
         if receipt_data.get('table_number'):
-            lines.append(f"Table: {receipt_data['table_number']}")
-
-        lines.append(f"Order Type: {receipt_data['order_type']}")
+            append("Table: %s" % receipt_data['table_number'])
 
-        return lines
+        append("Order Type: %s" % receipt_data['order_type'])
 
-    def _generate_items_section(self, receipt_data: Dict[str, Any]) -> List[str]:
-        """Generate the items section of the receipt."""
-        lines = []
-
-        lines.append(self.separator_char * self.width)
+    def _append_items_section(self, lines: List[str], receipt_data: Dict[str, Any]) -> None:
+        """Append the items section of the receipt."""
+        lines.append(self._sep_line)
         lines.append("ITEMS")
-        lines.append(self.separator_char * self.width)
+        lines.append(self._sep_line)
 
         # Column headers
-        header = f"{'Item':<20} {'Qty':<4} {'Price':<8} {'Total':<8}"
+        header = _ITEM_HEADER_FMT % ('Item', 'Qty', 'Price', 'Total')
         lines.append(header)
         lines.append("-" * len(header))
 
         # Items
-        for item in receipt_data['items']:
-            name = item['name']
-            if len(name) > 20:
-                name = name[:17] + "..."
+        _render_item_lines(receipt_data['items'], lines)
 
-            qty = str(item['quantity'])
-            unit_price = f"${item['unit_price']:.2f}"
-            subtotal = f"${item['subtotal']:.2f}"
-
-            item_line = f"{name:<20} {qty:<4} {unit_price:<8} {subtotal:<8}"
-            lines.append(item_line)
-
-            # Add special instructions if present
-            if item.get('special_instructions'):
-                instructions = item['special_instructions']
-                if len(instructions) > 40:
-                    instructions = instructions[:37] + "..."
-                lines.append(f"  * {instructions}")
-
-        return lines
-
-    def _generate_totals_section(self, receipt_data: Dict[str, Any]) -> List[str]:
-        """Generate the totals section of the receipt."""
-        lines = []
+    def _append_totals_section(self, lines: List[str], receipt_data: Dict[str, Any]) -> None:
+        """Append the totals section of the receipt."""
+        append = lines.append
 
-        lines.append(self.separator_char * self.width)
+        append(self._sep_line)
 
         # Subtotal
-        subtotal_line = f"{'Subtotal:':<30} ${receipt_data['subtotal']:>10.2f}"
-        lines.append(subtotal_line)
+        append("%-30s $%10.2f" % ('Subtotal:', receipt_data['subtotal']))
 
         # Tax
-        tax_rate = receipt_data['tax_rate']
-        tax_amount = receipt_data['tax_amount']
-        tax_line = f"{'Tax (' + f'{tax_rate:.1f}%' + '):':<30} ${tax_amount:>10.2f}"
-        lines.append(tax_line)
+        tax_label = "Tax (%.1f%%):" % receipt_data['tax_rate']
+        append("%-30s $%10.2f" % (tax_label, receipt_data['tax_amount']))
 
         # Total
-        lines.append(self.separator_char * self.width)
-        total_line = f"{'TOTAL:':<30} ${receipt_data['total_amount']:>10.2f}"
-        lines.append(total_line)
-        lines.append(self.double_separator_char * self.width)
+        append(self._sep_line)
+        append("%-30s $%10.2f" % ('TOTAL:', receipt_data['total_amount']))
+        append(self._dsep_line)
 
         # Item count
-        item_count = receipt_data['item_count']
-        count_line = f"Total Items: {item_count}"
-        lines.append(count_line)
+        append("Total Items: %d" % receipt_data['item_count'])
 
-        return lines
-
-    def _generate_footer(self) -> List[str]:
-        """Generate the receipt footer section."""
-        lines = []
-
-        # Thank you message
-        lines.append("")
-        lines.append(self._center_text("Thank you for your business!"))
-        lines.append(self._center_text("Please come again!"))
-
-        # Tax ID if available
-        if "tax_id" in self.restaurant_info:
-            lines.append("")
-            lines.append(self._center_text(self.restaurant_info["tax_id"]))
-
-        # Website if available
-        if "website" in self.restaurant_info:
-            lines.append(self._center_text(self.restaurant_info["website"]))
-
-        return lines
+    def _append_footer(self, lines: List[str]) -> None:
+        """Append the receipt footer section."""
+        lines.extend(self._footer_text_cache)
 
     def _center_text(self, text: str) -> str:
         """Center text within the receipt width."""
-        if len(text) >= self.width:
-            return text
-
-        padding = (self.width - len(text)) // 2
-        return " " * padding + text
+        # Left padding only (no trailing spaces), rounded down; rjust is a
+        # no-op when the text already fills the width
+        return text.rjust((self.width + len(text)) // 2)
 
     def _generate_receipt_number(self) -> str:
         """Generate a unique receipt number."""
-        self._receipt_counter += 1
-        timestamp = datetime.now().strftime("%y%m%d")
-        return f"R{timestamp}{self._receipt_counter:04d}"
+        number = next(self._receipt_counter)
+        today = date.today()
+        if today != self._cached_day:
+            self._cached_day = today
+            self._cached_day_str = today.strftime("%y%m%d")
+        return f"R{self._cached_day_str}{number:04d}"
 
     def save_receipt_to_file(self, order: Order, output_dir: str,
                            filename: Optional[str] = None) -> str:
@@ -288,13 +567,91 @@ class ReceiptGenerator:
             with open(file_path, 'w', encoding='utf-8') as file:
                 file.write(receipt_text)
 
-            self.logger.info(f"Receipt saved to: {file_path}")
+            self.logger.info("Receipt saved to: %s", file_path)
             return str(file_path)
 
         except Exception as e:
-            self.logger.error(f"Failed to save receipt to file: {e}")
+            self.logger.error("Failed to save receipt to file: %s", e)
             raise IOError(f"Could not save receipt: {e}")
 
+    def save_receipts_to_files(self, orders: List[Order], output_dir: str) -> List[str]:
+        """
+        Save text receipts for many orders, e.g. for an end-of-day run.
+
+        The output directory is created once, and each receipt is written
+        with a single ``os.write`` of its encoded bytes, without going
+        through a buffered file object.
+
+        Args:
+            orders (List[Order]): Orders to generate receipts for
+            output_dir (str): Directory to save the receipts
+
+        Returns:
+            List[str]: Paths to the saved receipt files, in order
+
+        Raises:
+            IOError: If a receipt cannot be saved
+        """
+        try:
+            output_path = Path(output_dir)
+            output_path.mkdir(parents=True, exist_ok=True)
+
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+            saved_paths = []
+
+            for order in orders:
+                file_path = output_path / f"receipt_{order.order_id}_{timestamp}.txt"
+                receipt_text = self.generate_receipt_text(order)
+                if os.linesep != "\n":
+                    receipt_text = receipt_text.replace("\n", os.linesep)
+                payload = memoryview(receipt_text.encode('utf-8'))
+
+                fd = os.open(file_path, flags, 0o644)
+                try:
+                    while payload:
+                        payload = payload[os.write(fd, payload):]
+                finally:
+                    os.close(fd)
+
+                saved_paths.append(str(file_path))
+
+            self.logger.info("Saved %d receipts to: %s", len(saved_paths), output_path)
+            return saved_paths
+
+        except Exception as e:
+            self.logger.error("Failed to save receipts to files: %s", e)
+            raise IOError(f"Could not save receipts: {e}")
+
+    def save_receipts_batch(self, orders: List[Order], output_dir: str,
+                            workers: int = 4) -> List[str]:
+        """
+        Save text receipts for many orders using a pool of worker threads.
+
+        Each order is handed to ``save_receipt_to_file`` on the pool, so the
+        file writes (which release the GIL) overlap with rendering.
+
+        Args:
+            orders (List[Order]): Orders to generate receipts for
+            output_dir (str): Directory to save the receipts
+            workers (int, optional): Number of worker threads (default 4)
+
+        Returns:
+            List[str]: Paths to the saved receipt files, in order
+
+        Raises:
+            IOError: If a receipt cannot be saved
+        """
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = [executor.submit(self.save_receipt_to_file, order, output_dir)
+                       for order in orders]
+            saved_paths = [future.result() for future in futures]
+
+        self.logger.info("Saved %d receipts to: %s", len(saved_paths), output_dir)
+        return saved_paths
+
     def print_receipt(self, order: Order, printer_name: Optional[str] = None) -> bool:
         """
         Print receipt to system printer (placeholder implementation).
@@ -317,17 +674,18 @@ class ReceiptGenerator:
             # In a real implementation, this would use printer drivers
             # or send to a network printer
 
-            self.logger.info(f"Receipt for order {order.order_id} sent to printer")
+            self.logger.info("Receipt for order %s sent to printer", order.order_id)
 
-            # For demonstration, we'll just log the receipt
-            print("=== PRINTING RECEIPT ===")
-            print(receipt_text)
-            print("=== END RECEIPT ===")
+            # For demonstration, echo the receipt when debugging
+            if self.logger.isEnabledFor(logging.DEBUG):
+                print("=== PRINTING RECEIPT ===")
+                print(receipt_text)
+                print("=== END RECEIPT ===")
 
             return True
 
         except Exception as e:
-            self.logger.error(f"Failed to print receipt: {e}")
+            self.logger.error("Failed to print receipt: %s", e)
             return False
 
     def generate_receipt_html(self, order: Order, receipt_number: Optional[str] = None) -> str:
@@ -342,189 +700,101 @@ class ReceiptGenerator:
             str: HTML formatted receipt
         """
         try:
-            receipt_data = order.get_receipt_data()
+            frozen_data = _freeze_receipt_data(order.get_receipt_data())
             receipt_num = receipt_number or self._generate_receipt_number()
+            return self._compose_html(frozen_data, receipt_num)
 
-            html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Receipt - {receipt_num}</title>
-    <style>
-        body {{
-            font-family: 'Courier New', monospace;
-            max-width: 400px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f9f9f9;
-        }}
-        .receipt {{
-            background-color: white;
-            padding: 20px;
-            border: 1px solid #ddd;
-            border-radius: 5px;
-        }}
-        .header {{
-            text-align: center;
-            border-bottom: 2px solid #333;
-            padding-bottom: 10px;
-            margin-bottom: 15px;
-        }}
-        .restaurant-name {{
-            font-size: 18px;
-            font-weight: bold;
-            margin-bottom: 5px;
-        }}
-        .contact-info {{
-            font-size: 12px;
-            color: #666;
-        }}
-        .order-info {{
-            margin-bottom: 15px;
-            border-bottom: 1px solid #ddd;
-            padding-bottom: 10px;
-        }}
-        .items-table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-bottom: 15px;
-        }}
-        .items-table th, .items-table td {{
-            text-align: left;
-            padding: 5px;
-            border-bottom: 1px solid #eee;
-        }}
-        .items-table th {{
-            background-color: #f5f5f5;
-            font-weight: bold;
-        }}
-        .totals {{
-            border-top: 2px solid #333;
-            padding-top: 10px;
-        }}
-        .total-line {{
-            display: flex;
-            justify-content: space-between;
-            margin: 5px 0;
-        }}
-        .grand-total {{
-            font-weight: bold;
-            border-top: 1px solid #333;
-            padding-top: 5px;
-            margin-top: 10px;
-        }}
-        .footer {{
-            text-align: center;
-            margin-top: 20px;
-            padding-top: 15px;
-            border-top: 1px solid #ddd;
-            color: #666;
-        }}
-        .special-instructions {{
-            font-style: italic;
-            color: #666;
-            font-size: 11px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="receipt">
-        <!-- Header -->
-        <div class="header">
-            <div class="restaurant-name">{self.restaurant_info.get('name', 'Restaurant').upper()}</div>
-            <div class="contact-info">
-                {self.restaurant_info.get('address_line1', '')}<br>
-                {self.restaurant_info.get('address_line2', '')}<br>
-                Phone: {self.restaurant_info.get('phone', '')}<br>
-                {self.restaurant_info.get('email', '')}
-            </div>
-        </div>
+        except Exception as e:
+            self.logger.error("Failed to generate HTML receipt: %s", e)
+            return f"<html><body><h1>Error generating receipt: {e}</h1></body></html>"
 
-        <!-- Receipt Info -->
-        <div>
-            <strong>Receipt #:</strong> {receipt_num}<br>
-            <strong>Date:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-        </div>
+    def generate_receipt_html_fragment(self, order: Order,
+                                       receipt_number: Optional[str] = None) -> str:
+        """
+        Generate only the ``<div class="receipt">`` block of the HTML receipt.
 
-        <!-- Order Info -->
-        <div class="order-info">
-            <strong>Order ID:</strong> {receipt_data['order_id']}<br>
-            <strong>Order Time:</strong> {receipt_data['timestamp']}<br>
-            {'<strong>Customer:</strong> ' + receipt_data['customer_name'] + '<br>' if receipt_data.get('customer_name') else ''}
-            {'<strong>Phone:</strong> ' + receipt_data['customer_phone'] + '<br>' if receipt_data.get('customer_phone') else ''}
-            {'<strong>Table:</strong> ' + receipt_data['table_number'] + '<br>' if receipt_data.get('table_number') else ''}
-            <strong>Order Type:</strong> {receipt_data['order_type']}
-        </div>
+        Suited to clients that embed the receipt in an existing page and
+        bring their own styling, as it omits the doctype, head and CSS.
 
-        <!-- Items -->
-        <table class="items-table">
-            <thead>
-                <tr>
-                    <th>Item</th>
-                    <th>Qty</th>
-                    <th>Price</th>
-                    <th>Total</th>
-                </tr>
-            </thead>
-            <tbody>
-"""
+        Args:
+            order (Order): The order to generate receipt for
+            receipt_number (str, optional): Custom receipt number
 
-            # Add items
-            for item in receipt_data['items']:
-                html += f"""
-                <tr>
-                    <td>{item['name']}</td>
-                    <td>{item['quantity']}</td>
-                    <td>${item['unit_price']:.2f}</td>
-                    <td>${item['subtotal']:.2f}</td>
-                </tr>
-"""
-                if item.get('special_instructions'):
-                    html += f"""
-                <tr>
-                    <td colspan="4" class="special-instructions">
-                        * {item['special_instructions']}
-                    </td>
-                </tr>
-"""
+        Returns:
+            str: HTML receipt fragment
+        """
+        try:
+            frozen_data = _freeze_receipt_data(order.get_receipt_data())
+            receipt_num = receipt_number or self._generate_receipt_number()
+            return self._compose_html_fragment(frozen_data, escape(receipt_num))
 
-            html += f"""
-            </tbody>
-        </table>
+        except Exception as e:
+            self.logger.error("Failed to generate HTML receipt: %s", e)
+            return f"<div><h1>Error generating receipt: {e}</h1></div>"
+
+    def _compose_html(self, frozen_data: Tuple, receipt_num: str) -> str:
+        """Wrap the HTML receipt fragment in the styled document."""
+        receipt_num = escape(receipt_num)
+        return "".join((
+            _RECEIPT_HTML_HEAD,
+            receipt_num,
+            "</title>\n",
+            _RECEIPT_CSS,
+            "</head>\n<body>\n",
+            self._compose_html_fragment(frozen_data, receipt_num),
+            "\n</body>\n</html>\n",
+        ))
+
+    def _compose_html_fragment(self, frozen_data: Tuple, receipt_num: str) -> str:
+        """Join the per-receipt HTML header with the cached order sections."""
+        return "".join((
+            f"""    <div class="receipt">
+        <!-- Header -->
+{self._header_html_cache}
 
-        <!-- Totals -->
-        <div class="totals">
-            <div class="total-line">
-                <span>Subtotal:</span>
-                <span>${receipt_data['subtotal']:.2f}</span>
-            </div>
-            <div class="total-line">
-                <span>Tax ({receipt_data['tax_rate']:.1f}%):</span>
-                <span>${receipt_data['tax_amount']:.2f}</span>
-            </div>
-            <div class="total-line grand-total">
-                <span>TOTAL:</span>
-                <span>${receipt_data['total_amount']:.2f}</span>
-            </div>
-            <div style="margin-top: 10px;">
-                <strong>Total Items:</strong> {receipt_data['item_count']}
-            </div>
-        </div>
+        <!-- Receipt Info -->
+        <div>
+            <strong>Receipt #:</strong> {receipt_num}<br>
+            <strong>Date:</strong> {datetime.now().isoformat(sep=' ', timespec='seconds')}
+        </div>""",
+            self._render_html_body(frozen_data),
+            "    </div>",
+        ))
 
-        <!-- Footer -->
-        <div class="footer">
-            <div>Thank you for your business!</div>
-            <div>Please come again!</div>
-            {'<div>' + self.restaurant_info.get('tax_id', '') + '</div>' if self.restaurant_info.get('tax_id') else ''}
-            {'<div>' + self.restaurant_info.get('website', '') + '</div>' if self.restaurant_info.get('website') else ''}
-        </div>
-    </div>
-</body>
-</html>
-"""
-            return html
+    def _build_html_body(self, frozen_data: Tuple) -> str:
+        """
+        Render the HTML receipt below the header; cached per receipt data.
 
-        except Exception as e:
-            self.logger.error(f"Failed to generate HTML receipt: {e}")
-            return f"<html><body><h1>Error generating receipt: {e}</h1></body></html>"
\ No newline at end of file
+        Args:
+            frozen_data (Tuple): Receipt data from ``_freeze_receipt_data``
+
+        Returns:
+            str: Order info, items, totals and footer markup
+        """
+        receipt_data = _thaw_receipt_data(frozen_data)
+        esc = escape
+        customer_name = receipt_data.get('customer_name')
+        customer_phone = receipt_data.get('customer_phone')
+        table_number = receipt_data.get('table_number')
+        parts = [_HTML_ORDER_INFO_FMT % {
+            'order_id': esc(receipt_data['order_id']),
+            'timestamp': receipt_data['timestamp'],
+            'customer_line': '<strong>Customer:</strong> %s<br>' % esc(customer_name) if customer_name else '',
+            'phone_line': '<strong>Phone:</strong> %s<br>' % esc(customer_phone) if customer_phone else '',
+            'table_line': '<strong>Table:</strong> %s<br>' % esc(table_number) if table_number else '',
+            'order_type': receipt_data['order_type'],
+        }]
+        append = parts.append
+
+        # Add items
+        for item in receipt_data['items']:
+            append(_HTML_ITEM_FMT % (
+                esc(item['name']), item['quantity'], item['unit_price'], item['subtotal']
+            ))
+            instructions = item.get('special_instructions')
+            if instructions:
+                append(_HTML_INSTRUCTIONS_FMT % esc(instructions))
+
+        receipt_data['footer'] = self._footer_html_cache
+        append(_HTML_TOTALS_FMT % receipt_data)
+        return "".join(parts)
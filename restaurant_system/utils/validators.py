@@ -7,10 +7,57 @@ and data integrity checks throughout the application.
 
 import re
 from decimal import Decimal, InvalidOperation
-from typing import Optional, Union, List, Tuple
+from functools import lru_cache
+from typing import Callable, FrozenSet, Optional, Union, List, Tuple
 from datetime import datetime
 
 
+# Bounds and precision shared by the numeric validators
+_MAX_PRICE = Decimal('9999.99')
+_CENTS = Decimal('0.01')
+_TAX_RATE_PRECISION = Decimal('0.0001')
+_ZERO = Decimal('0')
+_ONE = Decimal('1')
+_HUNDRED = Decimal('100')
+
+
+def _to_decimal(value) -> Decimal:
+    """
+    Convert a validator input to Decimal without a needless str() round trip.
+
+    Floats still go through their shortest repr, so 0.1 becomes
+    Decimal('0.1') rather than its full binary expansion.
+    """
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, float):
+        return Decimal(repr(value))
+    if isinstance(value, str) or type(value) is int:
+        return Decimal(value)
+    return Decimal(str(value))
+
+
+def _parse_iso_date(value: str) -> Optional[datetime]:
+    """
+    Parse a stripped ``YYYY-MM-DD`` string without going through strptime.
+
+    Returns None when the value is not in that exact shape, so the caller
+    can fall back to strptime; raises ValueError for impossible dates.
+    """
+    if (len(value) == 10 and value.isascii()
+            and value[4] == '-' and value[7] == '-'
+            and value[:4].isdigit() and value[5:7].isdigit()
+            and value[8:].isdigit()):
+        return datetime(int(value[:4]), int(value[5:7]), int(value[8:]))
+    return None
+
+
+@lru_cache(maxsize=32)
+def _lower_set(categories: Tuple[str, ...]) -> FrozenSet[str]:
+    """Return the lowercased categories as a set, cached per category tuple."""
+    return frozenset(category.lower() for category in categories)
+
+
 class ValidationError(Exception):
     """Custom exception for validation errors."""
     pass
@@ -24,10 +71,29 @@ class InputValidator:
     with detailed error messages and flexible validation rules.
     """
 
-    # Regular expression patterns
-    PHONE_PATTERN = re.compile(r'^[\+]?[1-9][\d\s\-\(\)]{7,15}$')
-    EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-    ALPHANUMERIC_PATTERN = re.compile(r'^[a-zA-Z0-9\s\-\_]+$')
+    # Phone numbers: optional "+", a leading 1-9, then 7-15 digits or
+    # formatting characters: ASCII characters matched by the regex "\s"
+    # (including the \x1c-\x1f separators), hyphens and parentheses
+    _PHONE_SEPARATORS = b' \t\n\r\f\v\x1c\x1d\x1e\x1f-()'
+    _PHONE_ALLOWED = _PHONE_SEPARATORS + b'0123456789'
+    _PHONE_LEADING_DIGITS = frozenset(b'123456789')
+
+    # Email addresses (lowercased): local part, "@", then a domain ending
+    # in a dot and an alphabetic top-level label of 2+ letters
+    _EMAIL_DOMAIN_CHARS = b'abcdefghijklmnopqrstuvwxyz0123456789.-'
+    _EMAIL_LOCAL_CHARS = _EMAIL_DOMAIN_CHARS + b'_%+'
+
+    # Table numbers: deleting the allowed ASCII letters, digits, whitespace,
+    # hyphens and underscores must leave nothing behind
+    _TABLE_ALLOWED = str.maketrans('', '', ''.join(
+        chr(c) for c in range(128) if chr(c).isalnum() or chr(c).isspace() or chr(c) in '-_'
+    ))
+
+    # Characters not allowed in file names, mapped to underscores
+    _FILENAME_TRANS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
+    # Markup/script fragments rejected in search queries
+    _DANGEROUS_QUERY = re.compile(r'<script|javascript:|on(?:load|error|click)=', re.IGNORECASE)
 
     @staticmethod
     def validate_required_string(value: str, field_name: str,
@@ -47,11 +113,11 @@ class InputValidator:
         Raises:
             ValidationError: If validation fails
         """
-        if not isinstance(value, str):
+        try:
+            trimmed_value = value.strip()
+        except AttributeError:
             raise ValidationError(f"{field_name} must be a string")
 
-        trimmed_value = value.strip()
-
         if len(trimmed_value) < min_length:
             raise ValidationError(f"{field_name} must be at least {min_length} characters long")
 
@@ -60,6 +126,45 @@ class InputValidator:
 
         return trimmed_value
 
+    @staticmethod
+    def make_string_validator(field_name: str, min_length: int = 1,
+                              max_length: int = 255) -> Callable[[str], str]:
+        """
+        Build a required-string validator specialized for one field.
+
+        Behaves like ``validate_required_string`` with fixed arguments, but
+        the error messages are formatted once, when the validator is made.
+
+        Args:
+            field_name (str): Name of the field for error messages
+            min_length (int): Minimum allowed length
+            max_length (int): Maximum allowed length
+
+        Returns:
+            Callable[[str], str]: Validator returning the trimmed string
+        """
+        not_string = f"{field_name} must be a string"
+        too_short = f"{field_name} must be at least {min_length} characters long"
+        too_long = f"{field_name} must not exceed {max_length} characters"
+
+        def validate(value: str) -> str:
+            try:
+                trimmed_value = value.strip()
+            except AttributeError:
+                raise ValidationError(not_string)
+
+            length = len(trimmed_value)
+
+            if length < min_length:
+                raise ValidationError(too_short)
+
+            if length > max_length:
+                raise ValidationError(too_long)
+
+            return trimmed_value
+
+        return validate
+
     @staticmethod
     def validate_optional_string(value: Optional[str], field_name: str,
                                max_length: int = 255) -> str:
@@ -80,11 +185,11 @@ class InputValidator:
         if value is None:
             return ""
 
-        if not isinstance(value, str):
+        try:
+            trimmed_value = value.strip()
+        except AttributeError:
             raise ValidationError(f"{field_name} must be a string")
 
-        trimmed_value = value.strip()
-
         if len(trimmed_value) > max_length:
             raise ValidationError(f"{field_name} must not exceed {max_length} characters")
 
@@ -114,16 +219,16 @@ class InputValidator:
                 # Remove currency symbols if present
                 value = value.replace('$', '').replace(',', '')
 
-            decimal_price = Decimal(str(value))
+            decimal_price = _to_decimal(value)
 
-            if decimal_price < 0:
+            if decimal_price < _ZERO:
                 raise ValidationError(f"{field_name} cannot be negative")
 
-            if decimal_price > Decimal('9999.99'):
+            if decimal_price > _MAX_PRICE:
                 raise ValidationError(f"{field_name} cannot exceed $9999.99")
 
             # Round to 2 decimal places
-            return decimal_price.quantize(Decimal('0.01'))
+            return decimal_price.quantize(_CENTS)
 
         except (InvalidOperation, ValueError, TypeError):
             raise ValidationError(f"Invalid {field_name.lower()} format")
@@ -162,6 +267,25 @@ class InputValidator:
         except (ValueError, TypeError):
             raise ValidationError(f"Invalid {field_name.lower()} format")
 
+    @staticmethod
+    def validate_items_bulk(rows: List[dict]) -> List[Tuple[int, Decimal]]:
+        """
+        Validate the quantity and price of many order lines at once.
+
+        Args:
+            rows (List[dict]): Order lines with 'quantity' and 'price' keys
+
+        Returns:
+            List[Tuple[int, Decimal]]: Validated (quantity, price) per line
+
+        Raises:
+            ValidationError: If any line fails validation
+        """
+        validate_quantity = InputValidator.validate_quantity
+        validate_price = InputValidator.validate_price
+        return [(validate_quantity(row['quantity']), validate_price(row['price']))
+                for row in rows]
+
     @staticmethod
     def validate_phone_number(value: Optional[str], required: bool = False) -> str:
         """
@@ -177,19 +301,27 @@ class InputValidator:
         Raises:
             ValidationError: If validation fails
         """
-        if not value or not value.strip():
+        phone = value.strip() if value else ""
+        if not phone:
             if required:
                 raise ValidationError("Phone number is required")
             return ""
 
-        phone = value.strip()
+        if not phone.isascii():
+            raise ValidationError("Invalid phone number format")
 
-        # Remove common formatting characters for validation
-        clean_phone = re.sub(r'[\s\-\(\)]', '', phone)
+        raw = phone.encode('ascii')
+        number = raw[1:] if raw[:1] == b'+' else raw
+        rest = number[1:]
 
-        if not InputValidator.PHONE_PATTERN.match(phone):
+        if (not number or number[0] not in InputValidator._PHONE_LEADING_DIGITS
+                or not 7 <= len(rest) <= 15
+                or rest.translate(None, InputValidator._PHONE_ALLOWED)):
             raise ValidationError("Invalid phone number format")
 
+        # Remove common formatting characters for validation
+        clean_phone = raw.translate(None, InputValidator._PHONE_SEPARATORS)
+
         if len(clean_phone) < 7 or len(clean_phone) > 15:
             raise ValidationError("Phone number must be between 7 and 15 digits")
 
@@ -210,14 +342,25 @@ class InputValidator:
         Raises:
             ValidationError: If validation fails
         """
-        if not value or not value.strip():
+        email = value.strip() if value else ""
+        if not email:
             if required:
                 raise ValidationError("Email address is required")
             return ""
 
-        email = value.strip().lower()
+        email = email.lower()
+        if not email.isascii():
+            raise ValidationError("Invalid email address format")
+
+        raw = email.encode('ascii')
+        at = raw.find(b'@')
+        local, domain = raw[:at], raw[at + 1:]
+        dot = domain.rfind(b'.')
+        tld = domain[dot + 1:]
 
-        if not InputValidator.EMAIL_PATTERN.match(email):
+        if (at < 1 or dot < 1 or len(tld) < 2 or not tld.isalpha()
+                or local.translate(None, InputValidator._EMAIL_LOCAL_CHARS)
+                or domain.translate(None, InputValidator._EMAIL_DOMAIN_CHARS)):
             raise ValidationError("Invalid email address format")
 
         if len(email) > 254:  # RFC 5321 limit
@@ -239,12 +382,13 @@ class InputValidator:
         Raises:
             ValidationError: If validation fails
         """
-        if not value or not value.strip():
+        table_num = value.strip() if value else ""
+        if not table_num:
             return ""
 
-        table_num = value.strip().upper()
+        table_num = table_num.upper()
 
-        if not InputValidator.ALPHANUMERIC_PATTERN.match(table_num):
+        if table_num.translate(InputValidator._TABLE_ALLOWED):
             raise ValidationError("Table number can only contain letters, numbers, spaces, hyphens, and underscores")
 
         if len(table_num) > 10:
@@ -267,17 +411,15 @@ class InputValidator:
         Raises:
             ValidationError: If validation fails
         """
-        if not isinstance(value, str):
+        try:
+            category = value.strip().lower()
+        except AttributeError:
             raise ValidationError("Category must be a string")
 
-        category = value.strip().lower()
-
         if not category:
             raise ValidationError("Category cannot be empty")
 
-        valid_categories_lower = [cat.lower() for cat in valid_categories]
-
-        if category not in valid_categories_lower:
+        if category not in _lower_set(tuple(valid_categories)):
             raise ValidationError(f"Category must be one of: {', '.join(valid_categories)}")
 
         return category
@@ -287,6 +429,10 @@ class InputValidator:
         """
         Validate a tax rate.
 
+        Values above 1 are taken as percentages. Prefer
+        ``validate_tax_rate_fraction`` or ``validate_tax_rate_percent`` when
+        the caller knows which form it has.
+
         Args:
             value (Union[str, float, Decimal]): The tax rate to validate
 
@@ -297,28 +443,79 @@ class InputValidator:
             ValidationError: If validation fails
         """
         try:
-            if isinstance(value, str):
-                value = value.strip().replace('%', '')
-                if not value:
-                    raise ValidationError("Tax rate cannot be empty")
-
-            tax_rate = Decimal(str(value))
+            tax_rate = InputValidator._parse_tax_rate(value)
 
             # If the value is greater than 1, assume it's a percentage
-            if tax_rate > 1:
-                tax_rate = tax_rate / 100
+            if tax_rate > _ONE:
+                tax_rate = tax_rate / _HUNDRED
+
+            return InputValidator._validate_tax_common(tax_rate)
+
+        except (InvalidOperation, ValueError, TypeError):
+            raise ValidationError("Invalid tax rate format")
+
+    @staticmethod
+    def validate_tax_rate_fraction(value: Union[str, float, Decimal]) -> Decimal:
+        """
+        Validate a tax rate given as a fraction (0.08 for 8%).
+
+        Args:
+            value (Union[str, float, Decimal]): The tax rate to validate
+
+        Returns:
+            Decimal: The validated tax rate
 
-            if tax_rate < 0:
-                raise ValidationError("Tax rate cannot be negative")
+        Raises:
+            ValidationError: If validation fails
+        """
+        try:
+            return InputValidator._validate_tax_common(InputValidator._parse_tax_rate(value))
 
-            if tax_rate > 1:
-                raise ValidationError("Tax rate cannot exceed 100%")
+        except (InvalidOperation, ValueError, TypeError):
+            raise ValidationError("Invalid tax rate format")
 
-            return tax_rate.quantize(Decimal('0.0001'))  # 4 decimal places for precision
+    @staticmethod
+    def validate_tax_rate_percent(value: Union[str, float, Decimal]) -> Decimal:
+        """
+        Validate a tax rate given as a percentage (8 or "8%" for 8%).
+
+        Args:
+            value (Union[str, float, Decimal]): The tax rate to validate
+
+        Returns:
+            Decimal: The validated tax rate as a fraction
+
+        Raises:
+            ValidationError: If validation fails
+        """
+        try:
+            tax_rate = InputValidator._parse_tax_rate(value) / _HUNDRED
+            return InputValidator._validate_tax_common(tax_rate)
 
         except (InvalidOperation, ValueError, TypeError):
             raise ValidationError("Invalid tax rate format")
 
+    @staticmethod
+    def _parse_tax_rate(value: Union[str, float, Decimal]) -> Decimal:
+        """Convert tax rate input to Decimal, dropping whitespace and '%'."""
+        if isinstance(value, str):
+            value = value.strip().replace('%', '')
+            if not value:
+                raise ValidationError("Tax rate cannot be empty")
+
+        return _to_decimal(value)
+
+    @staticmethod
+    def _validate_tax_common(tax_rate: Decimal) -> Decimal:
+        """Bounds-check a fractional tax rate and round it to 4 places."""
+        if tax_rate < _ZERO:
+            raise ValidationError("Tax rate cannot be negative")
+
+        if tax_rate > _ONE:
+            raise ValidationError("Tax rate cannot exceed 100%")
+
+        return tax_rate.quantize(_TAX_RATE_PRECISION)  # 4 decimal places for precision
+
     @staticmethod
     def validate_date_string(value: str, date_format: str = "%Y-%m-%d") -> datetime:
         """
@@ -334,14 +531,58 @@ class InputValidator:
         Raises:
             ValidationError: If validation fails
         """
-        if not value or not value.strip():
+        value = value.strip() if value else ""
+        if not value:
             raise ValidationError("Date cannot be empty")
 
         try:
-            return datetime.strptime(value.strip(), date_format)
+            # Fast path for the default ISO format, skipping strptime
+            if date_format == "%Y-%m-%d":
+                parsed = _parse_iso_date(value)
+                if parsed is not None:
+                    return parsed
+
+            return datetime.strptime(value, date_format)
         except ValueError:
             raise ValidationError(f"Invalid date format. Expected format: {date_format}")
 
+    @staticmethod
+    def make_date_parser(date_format: str = "%Y-%m-%d") -> Callable[[str], datetime]:
+        """
+        Build a date parser specialized for one format.
+
+        Behaves like ``validate_date_string`` with a fixed ``date_format``,
+        but the format check and error message are settled once, which
+        suits parsing many values (e.g. every row of a report).
+
+        Args:
+            date_format (str): Expected date format
+
+        Returns:
+            Callable[[str], datetime]: Parser raising ValidationError on bad input
+        """
+        invalid_message = f"Invalid date format. Expected format: {date_format}"
+        strptime = datetime.strptime
+
+        if date_format == "%Y-%m-%d":
+            def convert(value: str) -> datetime:
+                parsed = _parse_iso_date(value)
+                return parsed if parsed is not None else strptime(value, date_format)
+        else:
+            def convert(value: str) -> datetime:
+                return strptime(value, date_format)
+
+        def parse(value: str) -> datetime:
+            value = value.strip() if value else ""
+            if not value:
+                raise ValidationError("Date cannot be empty")
+            try:
+                return convert(value)
+            except ValueError:
+                raise ValidationError(invalid_message)
+
+        return parse
+
     @staticmethod
     def validate_date_range(start_date: Optional[str], end_date: Optional[str],
                           date_format: str = "%Y-%m-%d") -> Tuple[Optional[datetime], Optional[datetime]]:
@@ -387,25 +628,9 @@ class InputValidator:
         if not filename:
             return "untitled"
 
-        # Remove or replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        sanitized = filename
-
-        for char in invalid_chars:
-            sanitized = sanitized.replace(char, '_')
-
-        # Remove leading/trailing dots and spaces
-        sanitized = sanitized.strip('. ')
-
-        # Limit length
-        if len(sanitized) > 100:
-            sanitized = sanitized[:100]
-
-        # Ensure it's not empty after sanitization
-        if not sanitized:
-            sanitized = "untitled"
-
-        return sanitized
+        # Replace invalid characters, remove leading/trailing dots and spaces,
+        # limit the length, and ensure it's not empty after sanitization
+        return filename.translate(InputValidator._FILENAME_TRANS).strip('. ')[:100] or "untitled"
 
     @staticmethod
     def validate_search_query(query: Optional[str], min_length: int = 1) -> str:
@@ -422,13 +647,12 @@ class InputValidator:
         Raises:
             ValidationError: If validation fails
         """
-        if not query or not query.strip():
+        query = query.strip() if query else ""
+        if not query:
             if min_length > 0:
                 raise ValidationError(f"Search query must be at least {min_length} characters long")
             return ""
 
-        query = query.strip()
-
         if len(query) < min_length:
             raise ValidationError(f"Search query must be at least {min_length} characters long")
 
@@ -436,12 +660,8 @@ class InputValidator:
             raise ValidationError("Search query cannot exceed 100 characters")
 
         # Check for potential injection attempts (basic protection)
-        dangerous_patterns = ['<script', 'javascript:', 'on(load|error|click)=']
-        query_lower = query.lower()
-
-        for pattern in dangerous_patterns:
-            if pattern in query_lower:
-                raise ValidationError("Invalid characters in search query")
+        if InputValidator._DANGEROUS_QUERY.search(query):
+            raise ValidationError("Invalid characters in search query")
 
         return query
 
@@ -476,12 +696,13 @@ class DataIntegrityValidator:
         # Validate order totals if present
         if 'items' in order_data and isinstance(order_data['items'], list):
             calculated_subtotal = sum(
-                item.get('subtotal', 0) for item in order_data['items']
+                (_to_decimal(item.get('subtotal', 0)) for item in order_data['items']),
+                _ZERO
             )
 
             if 'subtotal' in order_data:
-                reported_subtotal = order_data['subtotal']
-                if abs(calculated_subtotal - reported_subtotal) > 0.01:
+                reported_subtotal = _to_decimal(order_data['subtotal'])
+                if abs(calculated_subtotal - reported_subtotal) > _CENTS:
                     errors.append("Order subtotal does not match item totals")
 
         return errors
@@ -500,19 +721,26 @@ class DataIntegrityValidator:
         errors = []
         seen_ids = set()
         seen_names = set()
+        seen_ids_add = seen_ids.add
+        seen_names_add = seen_names.add
+        errors_append = errors.append
 
         for i, item in enumerate(menu_items):
             item_id = item.get('id')
-            item_name = item.get('name', '').lower().strip()
-
-            if item_id in seen_ids:
-                errors.append(f"Duplicate menu item ID at position {i}: {item_id}")
-            else:
-                seen_ids.add(item_id)
-
-            if item_name in seen_names:
-                errors.append(f"Duplicate menu item name at position {i}: {item.get('name')}")
-            else:
-                seen_names.add(item_name)
+            raw_name = item.get('name') or ''
+            item_name = raw_name.lower().strip()
+
+            # Items without an ID or name cannot clash with each other
+            if item_id is not None:
+                if item_id in seen_ids:
+                    errors_append(f"Duplicate menu item ID at position {i}: {item_id}")
+                else:
+                    seen_ids_add(item_id)
+
+            if item_name:
+                if item_name in seen_names:
+                    errors_append(f"Duplicate menu item name at position {i}: {raw_name}")
+                else:
+                    seen_names_add(item_name)
 
         return errors
\ No newline at end of file
@@ -1,312 +1,488 @@
 #!/usr/bin/env python3
 """
-Test script for Restaurant Order Management System.
+Test suite for Restaurant Order Management System.
 
-This script performs comprehensive testing of all system components
-to ensure proper functionality and data integrity.
+These pytest tests exercise all system components to ensure proper
+functionality and data integrity. Run them with ``python -m pytest
+test_system.py`` (or simply ``python test_system.py``).
 """
 
 import sys
-import os
 from pathlib import Path
 from decimal import Decimal
-import logging
+
+import pytest
 
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+DATA_DIR = project_root / "restaurant_system" / "data"
+
+
+@pytest.fixture
+def csv_handler(tmp_path):
+    """CSV handler working on a temporary data directory."""
+    from restaurant_system.utils import CSVHandler
+
+    handler = CSVHandler(tmp_path)
+    yield handler
+    handler.close()
+
+
+@pytest.fixture
+def test_item():
+    """A menu item used by the model tests."""
+    from restaurant_system.models import MenuItem
+
+    return MenuItem("Test Burger", "mains", Decimal("15.99"), "Delicious test burger")
+
+
 def test_imports():
     """Test that all modules can be imported successfully."""
-    print("Testing module imports...")
+    # Model, utility and GUI classes
+    from restaurant_system.models import MenuItem, Order, OrderItem, OrderStatus, OrderType  # noqa: F401
+    from restaurant_system.utils import CSVHandler, InputValidator, ReceiptGenerator  # noqa: F401
+    from restaurant_system.gui import RestaurantMainWindow  # noqa: F401
 
-    try:
-        # Test model imports
-        from restaurant_system.models import MenuItem, Order, OrderItem, OrderStatus, OrderType
-        print("✓ Model classes imported successfully")
 
-        # Test utility imports
-        from restaurant_system.utils import CSVHandler, InputValidator, ReceiptGenerator
-        print("✓ Utility classes imported successfully")
+def test_configuration():
+    """Test configuration loading."""
+    from restaurant_system import config
+
+    # Basic config values
+    assert config.APP_NAME == "Restaurant Order Management System"
+    assert config.DEFAULT_TAX_RATE > 0
+    assert config.RESTAURANT_INFO['name'] is not None
+
+    # Config functions
+    assert isinstance(config.get_restaurant_info(), dict)
+
 
-        # Test GUI imports
-        from restaurant_system.gui import RestaurantMainWindow
-        print("✓ GUI classes imported successfully")
+@pytest.mark.parametrize("filename", ["menu_items.csv", "orders.jsonl", "sales_reports.csv"])
+def test_data_files(filename):
+    """Test that required data files exist."""
+    assert (DATA_DIR / filename).exists(), f"Missing required file: {filename}"
 
-        return True
 
-    except ImportError as e:
-        print(f"✗ Import failed: {e}")
-        return False
+def test_menu_file_has_data():
+    """Test that the shipped menu items file contains items."""
+    with open(DATA_DIR / "menu_items.csv", 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+    assert len(lines) > 1, "Menu items file should have data"
 
-def test_data_models():
+
+def test_data_models(test_item):
     """Test data model functionality."""
-    print("\nTesting data models...")
+    from restaurant_system.models import Order, OrderStatus
+
+    # MenuItem creation
+    assert test_item.name == "Test Burger"
+    assert test_item.price == Decimal("15.99")
+
+    # Order creation
+    order = Order()
+    assert order.status == OrderStatus.PENDING
+    assert len(order.items) == 0
+
+    # Adding items to order
+    order.add_item(test_item, 2)
+    assert len(order.items) == 1
+    assert order.items[0].quantity == 2
+
+    # Order calculations
+    assert order.subtotal == Decimal("31.98")  # 15.99 * 2
+    assert order.total_amount > order.subtotal  # Should include tax
+
+
+def test_order_totals_follow_menu_price_changes():
+    """Test that order totals use the current price of shared menu items."""
+    from restaurant_system.models import MenuItem, Order
+
+    menu_item = MenuItem("Test Pasta", "mains", Decimal("10.00"))
+    order = Order()
+    order_item = order.add_item(menu_item, 2)
+
+    # Menu edits mutate the shared MenuItem in place
+    menu_item.price = Decimal("12.00")
+    assert order.subtotal == Decimal("24.00")
+
+    order.update_item_quantity(order_item, 3)
+    assert order.subtotal == Decimal("36.00")
+    assert order.item_count == 3
+
+
+def test_order_serialization_follows_menu_price_changes():
+    """Test that tax and serialized totals agree with the repriced items."""
+    from restaurant_system.models import MenuItem, Order
+
+    menu_item = MenuItem("Test Pasta", "mains", Decimal("10.00"))
+    order = Order(tax_rate=Decimal("0.10"))
+    order.add_item(menu_item, 2)
+    menu_item.price = Decimal("12.00")
 
-    try:
-        from restaurant_system.models import MenuItem, Order, OrderItem, OrderStatus, OrderType
-
-        # Test MenuItem creation
-        item = MenuItem("Test Burger", "mains", Decimal("15.99"), "Delicious test burger")
-        assert item.name == "Test Burger"
-        assert item.price == Decimal("15.99")
-        print("✓ MenuItem creation successful")
-
-        # Test Order creation
-        order = Order()
-        assert order.status == OrderStatus.PENDING
-        assert len(order.items) == 0
-        print("✓ Order creation successful")
-
-        # Test adding items to order
-        order.add_item(item, 2)
-        assert len(order.items) == 1
-        assert order.items[0].quantity == 2
-        print("✓ Order item addition successful")
-
-        # Test order calculations
-        assert order.subtotal == Decimal("31.98")  # 15.99 * 2
-        assert order.total_amount > order.subtotal  # Should include tax
-        print("✓ Order calculations successful")
-
-        return True
-
-    except Exception as e:
-        print(f"✗ Data model test failed: {e}")
-        return False
-
-def test_csv_operations():
+    assert order.tax_amount == Decimal("2.40")
+    assert order.total_amount == Decimal("26.40")
+
+    order_data = Order.bulk_to_dict([order])[0]
+    assert order_data['subtotal'] == sum(item['subtotal'] for item in order_data['items'])
+    assert order_data['subtotal'] == 24.0
+    assert order_data['total_amount'] == 26.4
+    assert order.get_receipt_data()['subtotal'] == 24.0
+
+
+@pytest.mark.parametrize("validator, value, expected", [
+    ("validate_price", "15.99", Decimal("15.99")),
+    ("validate_price", "$1,234.5", Decimal("1234.50")),
+    ("validate_quantity", " 3 ", 3),
+    ("validate_phone_number", "555-123-4567", "555-123-4567"),
+    ("validate_phone_number", "555\x1c123\x1f4567", "555\x1c123\x1f4567"),
+    ("validate_email", "test@example.com", "test@example.com"),
+    ("validate_email", " Test@Example.COM ", "test@example.com"),
+    ("validate_table_number", " t-5 ", "T-5"),
+    ("validate_tax_rate_percent", 8, Decimal("0.08")),
+    ("validate_tax_rate_percent", "8%", Decimal("0.08")),
+    ("validate_tax_rate_fraction", "0.08", Decimal("0.08")),
+    ("validate_tax_rate_fraction", 1, Decimal("1")),  # 100%, not 1%
+])
+def test_validation(validator, value, expected):
+    """Test that valid input is accepted and normalized."""
+    from restaurant_system.utils import InputValidator
+
+    assert getattr(InputValidator, validator)(value) == expected
+
+
+@pytest.mark.parametrize("validator, value", [
+    ("validate_price", "invalid"),
+    ("validate_price", "-1"),
+    ("validate_quantity", "0"),
+    ("validate_phone_number", "12345"),
+    ("validate_email", "not-an-email"),
+    ("validate_table_number", "T#5"),
+    ("validate_tax_rate_fraction", "8"),
+    ("validate_tax_rate_fraction", "-0.1"),
+    ("validate_tax_rate_percent", "150"),
+    ("validate_tax_rate_percent", "abc"),
+])
+def test_validation_rejects_invalid_input(validator, value):
+    """Test that invalid input raises ValidationError."""
+    from restaurant_system.utils import InputValidator, ValidationError
+
+    with pytest.raises(ValidationError):
+        getattr(InputValidator, validator)(value)
+
+
+def test_string_validator_factory():
+    """Test that a built string validator trims and checks lengths."""
+    from restaurant_system.utils import InputValidator, ValidationError
+
+    validate_name = InputValidator.make_string_validator("Name", min_length=2, max_length=5)
+    assert validate_name("  Bob ") == "Bob"
+
+    for value, message in ((" a ", "at least 2"), ("abcdef", "exceed 5"), (None, "must be a string")):
+        with pytest.raises(ValidationError, match=message):
+            validate_name(value)
+
+
+@pytest.mark.parametrize("date_format, value, expected", [
+    ("%Y-%m-%d", " 2024-02-29 ", (2024, 2, 29)),
+    ("%d/%m/%Y", "31/12/2024", (2024, 12, 31)),
+])
+def test_date_parser_factory(date_format, value, expected):
+    """Test that a built date parser accepts its format."""
+    from datetime import datetime
+    from restaurant_system.utils import InputValidator
+
+    assert InputValidator.make_date_parser(date_format)(value) == datetime(*expected)
+
+
+@pytest.mark.parametrize("value", ["", "2024-02-30", "24-1-1", "31/12/2024"])
+def test_date_parser_factory_rejects_invalid_dates(value):
+    """Test that a built date parser rejects empty and mismatched dates."""
+    from restaurant_system.utils import InputValidator, ValidationError
+
+    with pytest.raises(ValidationError):
+        InputValidator.make_date_parser()(value)
+
+
+def test_validate_items_bulk():
+    """Test that order lines are validated together and any bad line fails."""
+    from restaurant_system.utils import InputValidator, ValidationError
+
+    rows = [{'quantity': " 2 ", 'price': "1.5"}, {'quantity': 1, 'price': 3}]
+    assert InputValidator.validate_items_bulk(rows) == [(2, Decimal("1.50")), (1, Decimal("3.00"))]
+    assert InputValidator.validate_items_bulk([]) == []
+
+    for bad_row in ({'quantity': 0, 'price': 3}, {'quantity': 1, 'price': "-1"}):
+        with pytest.raises(ValidationError):
+            InputValidator.validate_items_bulk(rows + [bad_row])
+
+
+def test_csv_operations(csv_handler):
     """Test CSV file operations."""
-    print("\nTesting CSV operations...")
+    from restaurant_system.models import MenuItem
+
+    test_item = MenuItem("Test Item", "appetizers", Decimal("9.99"), "Test description")
+
+    # Load existing menu items
+    menu_items = csv_handler.load_menu_items()
+    original_count = len(menu_items)
 
+    # Add test item
+    menu_items.append(test_item)
+    csv_handler.save_menu_items(menu_items)
+
+    # Reload and verify
+    reloaded_items = csv_handler.load_menu_items()
+    assert len(reloaded_items) == original_count + 1
+    assert any(item.name == "Test Item" for item in reloaded_items)
+
+
+def test_data_directory_created_on_first_write(tmp_path):
+    """Test that a missing data directory is only created when writing."""
+    from restaurant_system.utils import CSVHandler
+    from restaurant_system.models import MenuItem
+
+    data_dir = tmp_path / "data"
+    handler = CSVHandler(data_dir)
     try:
-        from restaurant_system.utils import CSVHandler
-        from restaurant_system.models import MenuItem
-        from restaurant_system.config import DATA_DIR
+        assert not data_dir.exists()
+        assert handler.load_menu_items() == []
+        assert not data_dir.exists()
 
-        # Initialize CSV handler with data directory
-        csv_handler = CSVHandler(DATA_DIR)
+        assert handler.save_menu_items([MenuItem("Test Item", "appetizers", Decimal("9.99"))])
+        assert (data_dir / "orders.jsonl").exists()
+        assert (data_dir / "sales_reports.csv").exists()
+        assert len(handler.load_menu_items()) == 1
+    finally:
+        handler.close()
 
-        # Test menu item operations
-        test_item = MenuItem("Test Item", "appetizers", Decimal("9.99"), "Test description")
 
-        # Load existing menu items
-        menu_items = csv_handler.load_menu_items()
-        original_count = len(menu_items)
-        print(f"✓ Loaded {original_count} menu items")
+def test_load_all_resolves_orders_against_loaded_menu(csv_handler):
+    """Test that load_all returns orders built on the menu items it returns."""
+    from restaurant_system.models import MenuItem, Order
 
-        # Add test item
-        menu_items.append(test_item)
-        csv_handler.save_menu_items(menu_items)
-        print("✓ Menu item saved to CSV")
+    menu_item = MenuItem("Test Burger", "mains", Decimal("15.99"))
+    order = Order()
+    order.add_item(menu_item, 2)
+    csv_handler.save_menu_items([menu_item])
+    csv_handler.save_orders([order])
 
-        # Reload and verify
-        reloaded_items = csv_handler.load_menu_items()
-        assert len(reloaded_items) == original_count + 1
-        print("✓ Menu item successfully persisted")
+    menu_items, orders, sales = csv_handler.load_all()
+    assert [order.order_id for order in orders] == [order.order_id]
+    assert orders[0].items[0].menu_item is menu_items[0]
+    assert sales == []
 
-        # Remove test item
-        menu_items = [item for item in reloaded_items if item.name != "Test Item"]
-        csv_handler.save_menu_items(menu_items)
-        print("✓ Test data cleaned up")
 
-        return True
+def _sales_order():
+    """Build a small order to record as a sale."""
+    from restaurant_system.models import MenuItem, Order
 
-    except Exception as e:
-        print(f"✗ CSV operations test failed: {e}")
-        return False
+    order = Order(customer_name="Test Customer")
+    order.add_item(MenuItem("Test Burger", "mains", Decimal("15.99")), 1)
+    return order
 
-def test_validation():
-    """Test input validation functionality."""
-    print("\nTesting input validation...")
 
-    try:
-        from restaurant_system.utils import InputValidator, ValidationError
+def _sales_rows(csv_handler):
+    """Read the sales file as written on disk, without flushing first."""
+    with open(csv_handler.sales_file, 'r', encoding='utf-8') as file:
+        return file.read().splitlines()[1:]
 
-        # Test price validation
-        valid_price = InputValidator.validate_price("15.99")
-        assert valid_price == Decimal("15.99")
-        print("✓ Price validation successful")
 
-        try:
-            InputValidator.validate_price("invalid")
-            assert False, "Should have raised ValidationError"
-        except ValidationError:
-            print("✓ Invalid price correctly rejected")
+def test_sales_records_written_in_batches(csv_handler):
+    """Test that sales records are buffered until a batch fills up."""
+    batch = csv_handler._SALES_BATCH
+    for _ in range(batch - 1):
+        assert csv_handler.append_sales_record(_sales_order())
+    assert _sales_rows(csv_handler) == []
 
-        # Test phone validation
-        valid_phone = InputValidator.validate_phone_number("555-123-4567", required=False)
-        assert valid_phone == "555-123-4567"
-        print("✓ Phone validation successful")
+    assert csv_handler.append_sales_record(_sales_order())
+    assert len(_sales_rows(csv_handler)) == batch
 
-        # Test email validation
-        valid_email = InputValidator.validate_email("test@example.com", required=False)
-        assert valid_email == "test@example.com"
-        print("✓ Email validation successful")
 
-        return True
+def test_sales_flush_and_close(csv_handler):
+    """Test that forced flushes, loads, backups and close write pending records."""
+    csv_handler.append_sales_record(_sales_order())
+    assert csv_handler.flush_sales()
+    assert _sales_rows(csv_handler) == []
 
-    except Exception as e:
-        print(f"✗ Validation test failed: {e}")
-        return False
+    assert len(csv_handler.load_sales_data()) == 1
 
-def test_receipt_generation():
-    """Test receipt generation functionality."""
-    print("\nTesting receipt generation...")
+    csv_handler.append_sales_record(_sales_order())
+    backup_path = csv_handler.create_backup(csv_handler.sales_file)
+    assert len(backup_path.read_text(encoding='utf-8').splitlines()) == 3
 
-    try:
-        from restaurant_system.utils import ReceiptGenerator
-        from restaurant_system.models import MenuItem, Order, OrderType
+    csv_handler.append_sales_record(_sales_order())
+    csv_handler.close()
+    assert csv_handler._sales.fd is None
+    assert len(_sales_rows(csv_handler)) == 3
 
-        # Create test order
-        order = Order()
-        order.customer_name = "Test Customer"
-        order.customer_phone = "(555) 123-4567"
-        order.table_number = "5"
-        order.order_type = OrderType.DINE_IN
 
-        # Add test items
-        item1 = MenuItem("Test Burger", "mains", Decimal("15.99"), "Test burger")
-        item2 = MenuItem("Test Fries", "sides", Decimal("5.99"), "Test fries")
+def test_sales_cache_returns_independent_records(csv_handler):
+    """Test that editing loaded sales records does not change later loads."""
+    csv_handler.append_sales_record(_sales_order())
 
-        order.add_item(item1, 1)
-        order.add_item(item2, 2)
+    first_load = csv_handler.load_sales_data()
+    first_load[0]['total_amount'] = 0.0
+    second_load = csv_handler.load_sales_data()
+    second_load[0]['customer_name'] = "Edited"
 
-        # Generate receipt
-        receipt_gen = ReceiptGenerator()
-        receipt_text = receipt_gen.generate_receipt_text(order)
+    date = second_load[0]['date']
+    for records in (csv_handler.load_sales_data(), csv_handler.load_sales_data(date, date)):
+        assert records[0]['total_amount'] > 0
+        assert records[0]['customer_name'] == "Test Customer"
 
-        assert "Test Customer" in receipt_text
-        assert "Test Burger" in receipt_text
-        assert "Test Fries" in receipt_text
-        print("✓ Receipt generation successful")
 
-        return True
+def test_unclosed_handler_flushes_sales_when_collected(tmp_path):
+    """Test that a dropped handler flushes its sales and is not kept alive."""
+    import gc
+    import weakref
+    from restaurant_system.utils import CSVHandler
 
-    except Exception as e:
-        print(f"✗ Receipt generation test failed: {e}")
-        return False
+    handler = CSVHandler(tmp_path)
+    handler.append_sales_record(_sales_order())
+    handler_ref = weakref.ref(handler)
+    sales_file = handler.sales_file
 
-def test_data_files():
-    """Test that required data files exist and are properly formatted."""
-    print("\nTesting data files...")
+    del handler
+    gc.collect()
+    assert handler_ref() is None
+    assert len(sales_file.read_text(encoding='utf-8').splitlines()) == 2
 
-    try:
-        data_dir = Path(__file__).parent / "restaurant_system" / "data"
 
-        # Check required files exist
-        required_files = [
-            "menu_items.csv",
-            "orders.csv",
-            "sales_reports.csv"
-        ]
+def test_sales_flush_retry_after_partial_write(csv_handler, monkeypatch):
+    """Test that a failed flush leaves no partial batch behind to duplicate."""
+    import os
 
-        for filename in required_files:
-            file_path = data_dir / filename
-            assert file_path.exists(), f"Missing required file: {filename}"
-            print(f"✓ {filename} exists")
+    real_write = os.write
 
-        # Check menu items file has data
-        menu_file = data_dir / "menu_items.csv"
-        with open(menu_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            assert len(lines) > 1, "Menu items file should have data"
-            print(f"✓ Menu items file contains {len(lines)-1} items")
+    def failing_write(fd, data):
+        # Write part of the batch, then fail on the next call
+        monkeypatch.setattr(os, 'write', fail)
+        return real_write(fd, bytes(data[:len(data) // 2]))
 
-        return True
+    def fail(fd, data):
+        raise OSError("disk full")
 
-    except Exception as e:
-        print(f"✗ Data files test failed: {e}")
-        return False
+    csv_handler.append_sales_record(_sales_order())
+    csv_handler.append_sales_record(_sales_order())
+    monkeypatch.setattr(os, 'write', failing_write)
+    assert not csv_handler.flush_sales(force=True)
+    assert _sales_rows(csv_handler) == []
 
-def test_configuration():
-    """Test configuration loading."""
-    print("\nTesting configuration...")
+    monkeypatch.setattr(os, 'write', real_write)
+    assert csv_handler.flush_sales(force=True)
+    assert len(_sales_rows(csv_handler)) == 2
+
+LEGACY_ORDER_HEADERS = (
+    "id,order_id,created_at,timestamp,customer_name,customer_phone,table_number,"
+    "order_type,status,is_priority,notes,tax_rate,subtotal,tax_amount,total_amount,items_json\n"
+)
+
+
+def test_legacy_orders_csv_migration(tmp_path):
+    """Test that orders saved in the old orders.csv format are migrated to JSONL."""
+    import csv
+    from restaurant_system.utils import CSVHandler
+    from restaurant_system.models import MenuItem, OrderStatus
 
+    menu_item = MenuItem("Test Burger", "mains", Decimal("15.99"), item_id="burger")
+    items_json = '[{"menu_item_id": "burger", "quantity": 2, "special_instructions": ""}]'
+    with open(tmp_path / "orders.csv", 'w', newline='', encoding='utf-8') as file:
+        file.write(LEGACY_ORDER_HEADERS)
+        csv.writer(file).writerow([
+            "ORD-1", "ORD-1", "2024-01-01T12:00:00", "2024-01-01T12:00:00", "Test Customer",
+            "", "5", "dine_in", "ready", "True", "", "0.08", "31.98", "2.56", "34.54", items_json
+        ])
+
+    handler = CSVHandler(tmp_path)
     try:
-        from restaurant_system import config
-
-        # Test basic config values
-        assert config.APP_NAME == "Restaurant Order Management System"
-        assert config.DEFAULT_TAX_RATE > 0
-        assert config.RESTAURANT_INFO['name'] is not None
-        print("✓ Configuration loaded successfully")
-
-        # Test config functions
-        restaurant_info = config.get_restaurant_info()
-        assert isinstance(restaurant_info, dict)
-        print("✓ Configuration functions working")
-
-        return True
-
-    except Exception as e:
-        print(f"✗ Configuration test failed: {e}")
-        return False
-
-def run_all_tests():
-    """Run all test functions."""
-    print("=" * 60)
-    print("Restaurant Order Management System - Component Tests")
-    print("=" * 60)
-
-    tests = [
-        test_imports,
-        test_configuration,
-        test_data_files,
-        test_data_models,
-        test_validation,
-        test_csv_operations,
-        test_receipt_generation
+        assert (tmp_path / "orders.jsonl").exists()
+        orders = handler.load_orders({menu_item.id: menu_item}.get)
+    finally:
+        handler.close()
+
+    assert len(orders) == 1
+    assert orders[0].order_id == "ORD-1"
+    assert orders[0].status == OrderStatus.READY
+    assert orders[0].is_priority
+    assert orders[0].subtotal == Decimal("31.98")
+
+
+def test_legacy_orders_csv_migration_skips_bad_rows(tmp_path):
+    """Test that a legacy file with an unconvertible row is not migrated."""
+    from restaurant_system.utils import CSVHandler
+
+    (tmp_path / "orders.csv").write_text(
+        LEGACY_ORDER_HEADERS + "ORD-1,ORD-1,,,,,,dine_in,pending,False,,oops,0,0,0,[]\n",
+        encoding='utf-8'
+    )
+
+    CSVHandler(tmp_path).close()
+    assert not (tmp_path / "orders.jsonl").exists()
+
+
+def test_menu_reload_ignores_unsaved_edits(csv_handler):
+    """Test that reloading the menu returns the file contents, not edited objects."""
+    from restaurant_system.models import MenuItem
+
+    csv_handler.save_menu_items([MenuItem("Test Item", "appetizers", Decimal("9.99"))])
+
+    first_load = csv_handler.load_menu_items()
+    first_load[0].price = Decimal("12.50")
+
+    reloaded_item = csv_handler.load_menu_items()[0]
+    assert reloaded_item is not first_load[0]
+    assert reloaded_item.price == Decimal("9.99")
+
+
+def test_backup_never_writes_through_linked_backup(tmp_path):
+    """Test that re-taking a linked backup leaves the live file intact."""
+    from restaurant_system.utils import CSVHandler
+
+    live_file = tmp_path / "menu_items.csv"
+    live_file.write_text("id,name\n1,Test Item\n", encoding="utf-8")
+    backup_file = tmp_path / "menu_items_backup.csv"
+
+    # A second backup in the same second targets the same (linked) name
+    CSVHandler._fast_copy(live_file, backup_file, link=True)
+    CSVHandler._fast_copy(live_file, backup_file, link=True)
+    # Copying over a backup that is still linked to the live file
+    CSVHandler._fast_copy(live_file, backup_file)
+
+    assert live_file.read_text(encoding="utf-8") == "id,name\n1,Test Item\n"
+    assert backup_file.read_text(encoding="utf-8") == "id,name\n1,Test Item\n"
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "menu_items.csv", "menu_items_backup.csv"
     ]
 
-    passed = 0
-    failed = 0
-
-    for test_func in tests:
-        try:
-            success = test_func()
-            if success:
-                passed += 1
-            else:
-                failed += 1
-        except Exception as e:
-            print(f"✗ Test {test_func.__name__} crashed: {e}")
-            failed += 1
-
-    print("\n" + "=" * 60)
-    print(f"Test Results: {passed} passed, {failed} failed")
-    print("=" * 60)
-
-    if failed == 0:
-        print("🎉 All tests passed! System is ready for use.")
-        return True
-    else:
-        print("❌ Some tests failed. Please check the errors above.")
-        return False
-
-def main():
-    """Main test function."""
-    try:
-        # Setup logging for tests
-        logging.basicConfig(level=logging.WARNING)
 
-        # Run tests
-        success = run_all_tests()
+def test_receipt_generation():
+    """Test receipt generation functionality."""
+    from restaurant_system.utils import ReceiptGenerator
+    from restaurant_system.models import MenuItem, Order, OrderType
+
+    # Create test order
+    order = Order()
+    order.customer_name = "Test Customer"
+    order.customer_phone = "(555) 123-4567"
+    order.table_number = "5"
+    order.order_type = OrderType.DINE_IN
+
+    # Add test items
+    item1 = MenuItem("Test Burger", "mains", Decimal("15.99"), "Test burger")
+    item2 = MenuItem("Test Fries", "sides", Decimal("5.99"), "Test fries")
+
+    order.add_item(item1, 1)
+    order.add_item(item2, 2)
 
-        if success:
-            print("\nYou can now run the restaurant system with confidence!")
-            print("Use: python run_restaurant_system.py")
-        else:
-            print("\nPlease fix the issues before running the main application.")
+    # Generate receipt
+    receipt_text = ReceiptGenerator().generate_receipt_text(order)
 
-        return 0 if success else 1
+    assert "Test Customer" in receipt_text
+    assert "Test Burger" in receipt_text
+    assert "Test Fries" in receipt_text
 
-    except KeyboardInterrupt:
-        print("\nTests interrupted by user.")
-        return 1
-    except Exception as e:
-        print(f"Test framework error: {e}")
-        return 1
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-q"]))